@@ -13,5 +13,5 @@ from .project import (
     ProjectLitePermission,
     ProjectAdminPermission,
 )
-from .base import allow_permission, ROLE
+from .base import allow_permission, get_workspace_membership, get_workspace_role, ROLE
 from .documents import DocumentPermission, DocumentCollectionPermission
@@ -12,6 +12,31 @@ class ROLE(Enum):
     GUEST = 5
 
 
+def get_workspace_membership(request, slug):
+    """
+    Return the requesting user's active (role, workspace_id) in the workspace, or None.
+    Memoized on the request so permission checks and views share one lookup.
+    """
+    memberships = request.__dict__.setdefault("_workspace_memberships", {})
+    if slug not in memberships:
+        memberships[slug] = (
+            WorkspaceMember.objects.filter(
+                member=request.user,
+                workspace__slug=slug,
+                is_active=True,
+            )
+            .values_list("role", "workspace_id")
+            .first()
+        )
+    return memberships[slug]
+
+
+def get_workspace_role(request, slug):
+    """Return the requesting user's active role in the workspace, or None."""
+    membership = get_workspace_membership(request, slug)
+    return membership[0] if membership else None
+
+
 def allow_permission(allowed_roles, level="PROJECT", creator=False, model=None):
     def decorator(view_func):
         @wraps(view_func)
@@ -3,6 +3,7 @@ from rest_framework.permissions import BasePermission, SAFE_METHODS
 
 # Package imports
 from plane.db.models import WorkspaceMember, Document, DocumentShare
+from .base import get_workspace_role
 
 
 # Permission Mappings
@@ -31,11 +32,7 @@ class DocumentPermission(BasePermission):
             return False
 
         # User must be a workspace member
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            is_active=True,
-        ).exists()
+        return get_workspace_role(request, view.workspace_slug) is not None
 
     def has_object_permission(self, request, view, obj):
         if request.user.is_anonymous:
@@ -48,12 +45,7 @@ class DocumentPermission(BasePermission):
             return True
 
         # Check workspace admin status for read access
-        is_admin = WorkspaceMember.objects.filter(
-            member=user,
-            workspace__slug=view.workspace_slug,
-            role=Admin,
-            is_active=True,
-        ).exists()
+        is_admin = get_workspace_role(request, view.workspace_slug) == Admin
 
         # PRIVATE documents: owner only, but admins can view (with logging)
         if obj.access == Document.PRIVATE_ACCESS:
@@ -64,13 +56,17 @@ class DocumentPermission(BasePermission):
 
         # SHARED documents: check share permissions
         if obj.access == Document.SHARED_ACCESS:
-            share = DocumentShare.objects.filter(
-                document=obj,
-                user=user,
-                deleted_at__isnull=True,
-            ).first()
-
-            if not share:
+            share_permission = (
+                DocumentShare.objects.filter(
+                    document=obj,
+                    user=user,
+                    deleted_at__isnull=True,
+                )
+                .values_list("permission", flat=True)
+                .first()
+            )
+
+            if share_permission is None:
                 # Admin can view shared documents
                 if request.method in SAFE_METHODS and is_admin:
                     return True
@@ -81,7 +77,7 @@ class DocumentPermission(BasePermission):
                 return True
 
             # For mutations, need EDIT or ADMIN permission
-            return share.permission in [
+            return share_permission in [
                 DocumentShare.EDIT_PERMISSION,
                 DocumentShare.ADMIN_PERMISSION,
             ]
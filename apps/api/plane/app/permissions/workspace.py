@@ -3,6 +3,7 @@ from rest_framework.permissions import BasePermission, SAFE_METHODS
 
 # Package imports
 from plane.db.models import WorkspaceMember
+from .base import get_workspace_role
 
 
 # Permission Mappings
@@ -59,12 +60,7 @@ class WorkSpaceAdminPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            role__in=[Admin, Member],
-            is_active=True,
-        ).exists()
+        return get_workspace_role(request, view.workspace_slug) in (Admin, Member)
 
 
 class WorkspaceEntityPermission(BasePermission):
@@ -1,10 +1,11 @@
 # Python imports
 import json
 from datetime import datetime
+from functools import partial
 from django.core.serializers.json import DjangoJSONEncoder
 
 # Django imports
-from django.db import connection
+from django.db import connection, transaction
 from django.db.models import Q, Count, Exists, OuterRef
 from django.http import StreamingHttpResponse
 
@@ -14,7 +15,13 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 
 # Package imports
-from plane.app.permissions import DocumentPermission, DocumentCollectionPermission, allow_permission, ROLE
+from plane.app.permissions import (
+    DocumentPermission,
+    DocumentCollectionPermission,
+    allow_permission,
+    get_workspace_role,
+    ROLE,
+)
 from plane.app.serializers import (
     DocumentSerializer,
     DocumentDetailSerializer,
@@ -29,7 +36,9 @@ from plane.db.models import (
     Workspace,
     WorkspaceMember,
 )
+from plane.bgtasks.document_access_log_task import document_access_log_task
 from plane.utils.error_codes import ERROR_CODES
+from plane.utils.exception_logger import log_exception
 
 # Local imports
 from ..base import BaseViewSet, BaseAPIView
@@ -49,19 +58,48 @@ def unarchive_archive_document_and_descendants(document_id, archived_at):
         cursor.execute(sql, [document_id, archived_at])
 
 
-def log_document_access(document, user, access_type, request, metadata=None):
-    """Log access to a document for audit compliance."""
-    DocumentAccessLog.objects.create(
-        document=document,
-        user=user,
-        access_type=access_type,
-        ip_address=get_client_ip(request),
-        user_agent=request.META.get("HTTP_USER_AGENT", "")[:500],
-        workspace=document.workspace,
-        metadata=metadata or {},
+def log_document_access(document, user, access_type, request, metadata=None, defer=False):
+    """
+    Log access to a document for audit compliance.
+
+    With defer=True the row is written by a retrying background task once the
+    request's writes commit; if the task cannot be queued it is written inline.
+    """
+    if not defer:
+        DocumentAccessLog.objects.create(
+            document=document,
+            user=user,
+            access_type=access_type,
+            ip_address=get_client_ip(request),
+            user_agent=request.META.get("HTTP_USER_AGENT", "")[:500],
+            workspace_id=document.workspace_id,
+            metadata=metadata or {},
+        )
+        return
+
+    transaction.on_commit(
+        partial(
+            queue_document_access_log,
+            document_id=str(document.id),
+            user_id=str(user.id),
+            workspace_id=str(document.workspace_id),
+            access_type=access_type,
+            ip_address=get_client_ip(request),
+            user_agent=request.META.get("HTTP_USER_AGENT", "")[:500],
+            metadata=metadata or {},
+        )
     )
 
 
+def queue_document_access_log(**access_log):
+    """Queue the audit row; if the broker is unavailable, write it in the request instead."""
+    try:
+        document_access_log_task.delay(**access_log)
+    except Exception as e:
+        log_exception(e)
+        document_access_log_task(**access_log)
+
+
 def get_client_ip(request):
     """Extract client IP from request."""
     x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
@@ -85,13 +123,8 @@ class DocumentViewSet(BaseViewSet):
         user = self.request.user
         slug = self.kwargs.get("slug")
 
-        # Check if user is admin
-        is_admin = WorkspaceMember.objects.filter(
-            member=user,
-            workspace__slug=slug,
-            role=20,  # Admin
-            is_active=True,
-        ).exists()
+        # Check if user is admin, reusing the role the permission check loaded
+        is_admin = get_workspace_role(self.request, slug) == ROLE.ADMIN.value
 
         base_query = Document.objects.filter(
             workspace__slug=slug,
@@ -112,7 +145,7 @@ class DocumentViewSet(BaseViewSet):
         shared_documents = DocumentShare.objects.filter(
             user=user,
             deleted_at__isnull=True,
-        ).values_list("document_id", flat=True)
+        ).values("document_id")
 
         return (
             base_query.filter(
@@ -414,13 +447,8 @@ class DocumentDescriptionViewSet(BaseViewSet):
     def get_document(self, slug, pk):
         user = self.request.user
 
-        # Check if user is admin
-        is_admin = WorkspaceMember.objects.filter(
-            member=user,
-            workspace__slug=slug,
-            role=20,
-            is_active=True,
-        ).exists()
+        # Check if user is admin, reusing the role the permission check loaded
+        is_admin = get_workspace_role(self.request, slug) == ROLE.ADMIN.value
 
         base_query = Document.objects.filter(
             pk=pk,
@@ -435,7 +463,7 @@ class DocumentDescriptionViewSet(BaseViewSet):
         shared_documents = DocumentShare.objects.filter(
             user=user,
             deleted_at__isnull=True,
-        ).values_list("document_id", flat=True)
+        ).values("document_id")
 
         return base_query.filter(
             Q(owned_by=user) | Q(id__in=shared_documents)
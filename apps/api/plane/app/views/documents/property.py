@@ -1,4 +1,8 @@
 # Django imports
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
 from django.utils.text import slugify
 
 # Third party imports
@@ -19,10 +23,14 @@ from plane.db.models import (
     Workspace,
     WorkspaceMember,
 )
+from plane.utils.uuid import is_valid_uuid
 
 # Local imports
 from ..base import BaseViewSet
 
+# Properties with no document_types apply to every document type
+ALL_DOCUMENT_TYPES_Q = Q(document_types=[])
+
 
 class PropertyDefinitionViewSet(BaseViewSet):
     """
@@ -52,9 +60,7 @@ class PropertyDefinitionViewSet(BaseViewSet):
         document_type = request.query_params.get("document_type")
         if document_type:
             # Include properties with empty document_types (apply to all) or matching document_type
-            queryset = queryset.filter(
-                models.Q(document_types=[]) | models.Q(document_types__contains=[document_type])
-            )
+            queryset = queryset.filter(ALL_DOCUMENT_TYPES_Q | Q(document_types__contains=[document_type]))
 
         # Filter by is_system
         is_system = request.query_params.get("is_system")
@@ -245,26 +251,27 @@ class DocumentPropertyValueViewSet(BaseViewSet):
         """Create a new property value."""
         value_data = self._extract_value_data(request.data, prop)
 
-        pv = DocumentPropertyValue.objects.create(
-            document=document,
-            property=prop,
-            workspace=document.workspace,
-            created_by=request.user,
-            updated_by=request.user,
-            **value_data,
-        )
+        with transaction.atomic():
+            pv = DocumentPropertyValue.objects.create(
+                document=document,
+                property=prop,
+                workspace=document.workspace,
+                created_by=request.user,
+                updated_by=request.user,
+                **value_data,
+            )
 
-        # Log activity
-        DocumentActivity.objects.create(
-            workspace=document.workspace,
-            document=document,
-            verb="property_created",
-            field=prop.slug,
-            new_value=str(request.data.get("value")),
-            actor=request.user,
-            created_by=request.user,
-            updated_by=request.user,
-        )
+            # Log activity
+            DocumentActivity.objects.create(
+                workspace=document.workspace,
+                document=document,
+                verb="property_created",
+                field=prop.slug,
+                new_value=str(request.data.get("value")),
+                actor=request.user,
+                created_by=request.user,
+                updated_by=request.user,
+            )
 
         return Response(
             DocumentPropertyValueSerializer(pv).data,
@@ -276,23 +283,32 @@ class DocumentPropertyValueViewSet(BaseViewSet):
         old_value = self._get_current_value(existing, prop)
         value_data = self._extract_value_data(request.data, prop)
 
+        # Skip the write and activity entry for idempotent updates
+        if self._is_unchanged(existing, value_data):
+            return Response(
+                DocumentPropertyValueSerializer(existing).data,
+                status=status.HTTP_200_OK,
+            )
+
         for key, value in value_data.items():
             setattr(existing, key, value)
         existing.updated_by = request.user
-        existing.save()
 
-        # Log activity
-        DocumentActivity.objects.create(
-            workspace=document.workspace,
-            document=document,
-            verb="property_updated",
-            field=prop.slug,
-            old_value=str(old_value),
-            new_value=str(request.data.get("value")),
-            actor=request.user,
-            created_by=request.user,
-            updated_by=request.user,
-        )
+        with transaction.atomic():
+            existing.save()
+
+            # Log activity
+            DocumentActivity.objects.create(
+                workspace=document.workspace,
+                document=document,
+                verb="property_updated",
+                field=prop.slug,
+                old_value=str(old_value),
+                new_value=str(request.data.get("value")),
+                actor=request.user,
+                created_by=request.user,
+                updated_by=request.user,
+            )
 
         return Response(
             DocumentPropertyValueSerializer(existing).data,
@@ -327,6 +343,17 @@ class DocumentPropertyValueViewSet(BaseViewSet):
 
         return value_data
 
+    def _is_unchanged(self, pv, value_data):
+        """Check whether the extracted value data matches what is already stored."""
+        for key, value in value_data.items():
+            try:
+                value = DocumentPropertyValue._meta.get_field(key).to_python(value)
+            except ValidationError:
+                return False
+            if getattr(pv, key) != value:
+                return False
+        return True
+
     def _get_current_value(self, pv, prop):
         """Get current value based on property type."""
         prop_type = prop.property_type
@@ -353,23 +380,32 @@ class DocumentPropertyValueViewSet(BaseViewSet):
         old_value = self._get_current_value(pv, pv.property)
         value_data = self._extract_value_data(request.data, pv.property)
 
+        # Skip the write and activity entry for idempotent updates
+        if self._is_unchanged(pv, value_data):
+            return Response(
+                DocumentPropertyValueSerializer(pv).data,
+                status=status.HTTP_200_OK,
+            )
+
         for key, value in value_data.items():
             setattr(pv, key, value)
         pv.updated_by = request.user
-        pv.save()
 
-        # Log activity
-        DocumentActivity.objects.create(
-            workspace=document.workspace,
-            document=document,
-            verb="property_updated",
-            field=pv.property.slug,
-            old_value=str(old_value),
-            new_value=str(request.data.get("value")),
-            actor=request.user,
-            created_by=request.user,
-            updated_by=request.user,
-        )
+        with transaction.atomic():
+            pv.save()
+
+            # Log activity
+            DocumentActivity.objects.create(
+                workspace=document.workspace,
+                document=document,
+                verb="property_updated",
+                field=pv.property.slug,
+                old_value=str(old_value),
+                new_value=str(request.data.get("value")),
+                actor=request.user,
+                created_by=request.user,
+                updated_by=request.user,
+            )
 
         return Response(
             DocumentPropertyValueSerializer(pv).data,
@@ -385,19 +421,21 @@ class DocumentPropertyValueViewSet(BaseViewSet):
         if not pv:
             return Response({"error": "Property value not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        # Log activity
-        DocumentActivity.objects.create(
-            workspace=document.workspace,
-            document=document,
-            verb="property_deleted",
-            field=pv.property.slug,
-            old_value=str(self._get_current_value(pv, pv.property)),
-            actor=request.user,
-            created_by=request.user,
-            updated_by=request.user,
-        )
+        with transaction.atomic():
+            # Log activity
+            DocumentActivity.objects.create(
+                workspace=document.workspace,
+                document=document,
+                verb="property_deleted",
+                field=pv.property.slug,
+                old_value=str(self._get_current_value(pv, pv.property)),
+                actor=request.user,
+                created_by=request.user,
+                updated_by=request.user,
+            )
+
+            pv.delete()
 
-        pv.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -449,16 +487,22 @@ class BulkDocumentPropertyValueViewSet(BaseViewSet):
 
         workspace = document.workspace
         results = {}
+        resolved = {}
 
-        for prop_key, value in properties.items():
-            # Try to find property by slug or ID
-            prop = PropertyDefinition.objects.filter(
-                workspace=workspace,
-                deleted_at__isnull=True,
-            ).filter(
-                models.Q(slug=prop_key) | models.Q(pk=prop_key)
-            ).first()
-
+        # Resolve every key by slug or ID in a single query
+        prop_ids = [prop_key for prop_key in properties if is_valid_uuid(str(prop_key))]
+        definitions = {}
+        for prop in PropertyDefinition.objects.filter(
+            workspace=workspace,
+            deleted_at__isnull=True,
+        ).filter(
+            Q(slug__in=list(properties)) | Q(pk__in=prop_ids)
+        ):
+            definitions[str(prop.id)] = prop
+            definitions[prop.slug] = prop
+
+        for prop_key in properties:
+            prop = definitions.get(str(prop_key))
             if not prop:
                 results[prop_key] = {"error": "Property not found"}
                 continue
@@ -468,19 +512,35 @@ class BulkDocumentPropertyValueViewSet(BaseViewSet):
                 results[prop_key] = {"error": f"Not available for document type '{document.document_type}'"}
                 continue
 
-            # Get or create property value
-            pv, created = DocumentPropertyValue.objects.get_or_create(
+            resolved[prop_key] = prop
+
+        # Load every existing value in one query and write them back in bulk
+        # instead of a get_or_create + save round-trip per property
+        values_by_property = {
+            pv.property_id: pv
+            for pv in DocumentPropertyValue.objects.filter(
                 document=document,
-                property=prop,
+                property_id__in=[prop.id for prop in resolved.values()],
                 deleted_at__isnull=True,
-                defaults={
-                    "workspace": workspace,
-                    "created_by": request.user,
-                    "updated_by": request.user,
-                }
             )
+        }
+
+        now = timezone.now()
+        for prop_key, prop in resolved.items():
+            pv = values_by_property.get(prop.id)
+            if pv is None:
+                pv = DocumentPropertyValue(
+                    document=document,
+                    property=prop,
+                    workspace=workspace,
+                    created_by=request.user,
+                )
+                values_by_property[prop.id] = pv
+            else:
+                pv.property = prop
 
             # Extract and set value
+            value = properties[prop_key]
             prop_type = prop.property_type
             if prop_type == "text" or prop_type == "url":
                 pv.value_text = value
@@ -494,12 +554,28 @@ class BulkDocumentPropertyValueViewSet(BaseViewSet):
                 pv.value_json = value
 
             pv.updated_by = request.user
-            pv.save()
+            pv.updated_at = now
+
+        to_create = [pv for pv in values_by_property.values() if pv._state.adding]
+        to_update = [pv for pv in values_by_property.values() if not pv._state.adding]
+
+        with transaction.atomic():
+            DocumentPropertyValue.objects.bulk_create(to_create)
+            DocumentPropertyValue.objects.bulk_update(
+                to_update,
+                [
+                    "value_text",
+                    "value_number",
+                    "value_date",
+                    "value_boolean",
+                    "value_json",
+                    "updated_by",
+                    "updated_at",
+                ],
+                batch_size=100,
+            )
 
-            results[prop_key] = DocumentPropertyValueSerializer(pv).data
+        for prop_key, prop in resolved.items():
+            results[prop_key] = DocumentPropertyValueSerializer(values_by_property[prop.id]).data
 
         return Response(results, status=status.HTTP_200_OK)
-
-
-# Import models at module level to avoid import issues
-from django.db import models
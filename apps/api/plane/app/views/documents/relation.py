@@ -1,4 +1,5 @@
 # Django imports
+from django.db import transaction
 from django.db.models import Q
 
 # Third party imports
@@ -21,6 +22,20 @@ from plane.db.models import (
 # Local imports
 from ..base import BaseViewSet
 
+# Keys of the grouped relations response, in response order
+RELATION_RESPONSE_KEYS = (
+    "blocking",
+    "blocked_by",
+    "relates_to",
+    "duplicate",
+    "start_before",
+    "start_after",
+    "finish_before",
+    "finish_after",
+    "implemented_by",
+    "implements",
+)
+
 
 class DocumentRelationViewSet(BaseViewSet):
     """
@@ -78,45 +93,43 @@ class DocumentRelationViewSet(BaseViewSet):
 
         queryset = self.get_queryset()
 
-        # Organize relations by type
-        relations = {
-            "blocking": [],
-            "blocked_by": [],
-            "relates_to": [],
-            "duplicate": [],
-            "start_before": [],
-            "start_after": [],
-            "finish_before": [],
-            "finish_after": [],
-            "implemented_by": [],
-            "implements": [],
-        }
-
+        # Split rows by direction so each group is serialized in one pass
+        forward_relations = []
+        reverse_relations = []
         for rel in queryset:
             if str(rel.document_id) == str(document_id):
-                # Forward relation
-                rel_type = rel.relation_type
-                relations[rel_type].append(
-                    DocumentRelationSerializer(rel, context={"request": request}).data
-                )
+                forward_relations.append(rel)
             else:
-                # Reverse relation - map to reverse type
-                reverse_type = DocumentRelationChoices._REVERSE_MAPPING.get(
-                    rel.relation_type, rel.relation_type
-                )
-                # Swap document and related_document for the response
-                rel_data = DocumentRelationSerializer(rel, context={"request": request}).data
-                # Swap IDs in response so "related_document" is always the other document
-                rel_data["related_document"] = str(rel.document_id)
-                rel_data["related_document_detail"] = {
-                    "id": str(rel.document.id),
-                    "name": rel.document.name,
-                    "document_type": rel.document.document_type,
-                    "sequence_id": rel.document.sequence_id,
-                    "state_id": str(rel.document.state_id) if rel.document.state_id else None,
-                    "logo_props": rel.document.logo_props,
-                }
-                relations[reverse_type].append(rel_data)
+                reverse_relations.append(rel)
+
+        # Organize relations by type
+        relations = {key: [] for key in RELATION_RESPONSE_KEYS}
+
+        forward_data = DocumentRelationSerializer(
+            forward_relations, many=True, context={"request": request}
+        ).data
+        for rel, rel_data in zip(forward_relations, forward_data):
+            relations[rel.relation_type].append(rel_data)
+
+        reverse_data = DocumentRelationSerializer(
+            reverse_relations, many=True, context={"request": request}
+        ).data
+        for rel, rel_data in zip(reverse_relations, reverse_data):
+            # Reverse relation - map to reverse type
+            reverse_type = DocumentRelationChoices._REVERSE_MAPPING.get(
+                rel.relation_type, rel.relation_type
+            )
+            # Swap IDs in response so "related_document" is always the other document
+            rel_data["related_document"] = str(rel.document_id)
+            rel_data["related_document_detail"] = {
+                "id": str(rel.document.id),
+                "name": rel.document.name,
+                "document_type": rel.document.document_type,
+                "sequence_id": rel.document.sequence_id,
+                "state_id": str(rel.document.state_id) if rel.document.state_id else None,
+                "logo_props": rel.document.logo_props,
+            }
+            relations[reverse_type].append(rel_data)
 
         return Response(relations, status=status.HTTP_200_OK)
 
@@ -166,28 +179,29 @@ class DocumentRelationViewSet(BaseViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Create relation
-        relation = DocumentRelation.objects.create(
-            document=document,
-            related_document=related_document,
-            relation_type=relation_type,
-            workspace=document.workspace,
-            created_by=request.user,
-            updated_by=request.user,
-        )
+        with transaction.atomic():
+            # Create relation
+            relation = DocumentRelation.objects.create(
+                document=document,
+                related_document=related_document,
+                relation_type=relation_type,
+                workspace=document.workspace,
+                created_by=request.user,
+                updated_by=request.user,
+            )
 
-        # Log activity
-        DocumentActivity.objects.create(
-            workspace=document.workspace,
-            document=document,
-            verb="relation_created",
-            field="relation",
-            new_value=f"{relation_type}: {related_document.name}",
-            new_identifier=related_document.id,
-            actor=request.user,
-            created_by=request.user,
-            updated_by=request.user,
-        )
+            # Log activity
+            DocumentActivity.objects.create(
+                workspace=document.workspace,
+                document=document,
+                verb="relation_created",
+                field="relation",
+                new_value=f"{relation_type}: {related_document.name}",
+                new_identifier=related_document.id,
+                actor=request.user,
+                created_by=request.user,
+                updated_by=request.user,
+            )
 
         return Response(
             DocumentRelationSerializer(relation, context={"request": request}).data,
@@ -208,21 +222,25 @@ class DocumentRelationViewSet(BaseViewSet):
         if not relation:
             return Response({"error": "Relation not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        # Log activity
-        other_document = relation.related_document if str(relation.document_id) == str(document_id) else relation.document
-        DocumentActivity.objects.create(
-            workspace=document.workspace,
-            document=document,
-            verb="relation_deleted",
-            field="relation",
-            old_value=f"{relation.relation_type}: {other_document.name}",
-            old_identifier=other_document.id,
-            actor=request.user,
-            created_by=request.user,
-            updated_by=request.user,
-        )
+        with transaction.atomic():
+            # Log activity
+            other_document = (
+                relation.related_document if str(relation.document_id) == str(document_id) else relation.document
+            )
+            DocumentActivity.objects.create(
+                workspace=document.workspace,
+                document=document,
+                verb="relation_deleted",
+                field="relation",
+                old_value=f"{relation.relation_type}: {other_document.name}",
+                old_identifier=other_document.id,
+                actor=request.user,
+                created_by=request.user,
+                updated_by=request.user,
+            )
+
+            relation.delete()
 
-        relation.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -289,27 +307,28 @@ class DocumentLinkViewSet(BaseViewSet):
         title = request.data.get("title", "")
         metadata = request.data.get("metadata", {})
 
-        link = DocumentLink.objects.create(
-            document=document,
-            url=url,
-            title=title,
-            metadata=metadata,
-            workspace=document.workspace,
-            created_by=request.user,
-            updated_by=request.user,
-        )
+        with transaction.atomic():
+            link = DocumentLink.objects.create(
+                document=document,
+                url=url,
+                title=title,
+                metadata=metadata,
+                workspace=document.workspace,
+                created_by=request.user,
+                updated_by=request.user,
+            )
 
-        # Log activity
-        DocumentActivity.objects.create(
-            workspace=document.workspace,
-            document=document,
-            verb="link_created",
-            field="link",
-            new_value=url,
-            actor=request.user,
-            created_by=request.user,
-            updated_by=request.user,
-        )
+            # Log activity
+            DocumentActivity.objects.create(
+                workspace=document.workspace,
+                document=document,
+                verb="link_created",
+                field="link",
+                new_value=url,
+                actor=request.user,
+                created_by=request.user,
+                updated_by=request.user,
+            )
 
         return Response(DocumentLinkSerializer(link).data, status=status.HTTP_201_CREATED)
 
@@ -337,17 +356,19 @@ class DocumentLinkViewSet(BaseViewSet):
         if not link:
             return Response({"error": "Link not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        # Log activity
-        DocumentActivity.objects.create(
-            workspace=document.workspace,
-            document=document,
-            verb="link_deleted",
-            field="link",
-            old_value=link.url,
-            actor=request.user,
-            created_by=request.user,
-            updated_by=request.user,
-        )
+        with transaction.atomic():
+            # Log activity
+            DocumentActivity.objects.create(
+                workspace=document.workspace,
+                document=document,
+                verb="link_deleted",
+                field="link",
+                old_value=link.url,
+                actor=request.user,
+                created_by=request.user,
+                updated_by=request.user,
+            )
+
+            link.delete()
 
-        link.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -1,3 +1,6 @@
+# Django imports
+from django.db.models import Exists, OuterRef
+
 # Third party imports
 from rest_framework import status
 from rest_framework.response import Response
@@ -6,11 +9,15 @@ from rest_framework.response import Response
 from plane.app.permissions import DocumentPermission
 from plane.app.serializers import DocumentShareSerializer
 from plane.db.models import Document, DocumentShare, DocumentAccessLog, WorkspaceMember
+from plane.utils.uuid import is_valid_uuid
 
 # Local imports
 from ..base import BaseViewSet
 from .document import log_document_access, get_client_ip
 
+# Potentially large content columns that the share endpoints never read
+DOCUMENT_CONTENT_FIELDS = ("description", "description_binary", "description_html", "description_stripped")
+
 
 class DocumentShareViewSet(BaseViewSet):
     """
@@ -23,38 +30,80 @@ class DocumentShareViewSet(BaseViewSet):
     permission_classes = [DocumentPermission]
 
     def get_queryset(self):
-        return DocumentShare.objects.filter(
-            workspace__slug=self.kwargs.get("slug"),
-            document_id=self.kwargs.get("document_id"),
-            deleted_at__isnull=True,
-        ).select_related("user", "document", "created_by")
+        return (
+            DocumentShare.objects.filter(
+                workspace__slug=self.kwargs.get("slug"),
+                document_id=self.kwargs.get("document_id"),
+                deleted_at__isnull=True,
+            )
+            .select_related("user", "document", "created_by")
+            # Share handlers never read the document content
+            .defer(*(f"document__{field}" for field in DOCUMENT_CONTENT_FIELDS))
+        )
 
-    def create(self, request, slug, document_id):
-        document = Document.objects.get(
-            pk=document_id,
-            workspace__slug=slug,
-            deleted_at__isnull=True,
+    def list_queryset(self):
+        """Narrow queryset for listing, limited to the columns the serializer reads."""
+        return (
+            DocumentShare.objects.filter(
+                workspace__slug=self.kwargs.get("slug"),
+                document_id=self.kwargs.get("document_id"),
+                deleted_at__isnull=True,
+            )
+            .select_related("user")
+            .only(
+                "id",
+                "document",
+                "user",
+                "permission",
+                "workspace",
+                "created_at",
+                "created_by",
+                "user__id",
+                "user__email",
+                "user__display_name",
+                "user__avatar",
+            )
         )
 
-        # Only owner can share
-        if document.owned_by_id != request.user.id:
-            # Check if user has admin share permission
-            user_share = DocumentShare.objects.filter(
-                document=document,
-                user=request.user,
+    def admin_share_exists(self, document_ref):
+        """Subquery checking whether the requesting user holds an admin share."""
+        return Exists(
+            DocumentShare.objects.filter(
+                document=OuterRef(document_ref),
+                user=self.request.user,
                 permission=DocumentShare.ADMIN_PERMISSION,
                 deleted_at__isnull=True,
-            ).first()
+            )
+        )
 
-            if not user_share:
-                return Response(
-                    {"error": "Only owner or share admins can share this document"},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
+    def create(self, request, slug, document_id):
+        document = (
+            Document.objects.filter(
+                workspace__slug=slug,
+                deleted_at__isnull=True,
+            )
+            .only("id", "owned_by", "workspace")
+            .annotate(is_admin_share=self.admin_share_exists("pk"))
+            .get(pk=document_id)
+        )
+
+        # Only owner or share admins can share
+        if document.owned_by_id != request.user.id and not document.is_admin_share:
+            return Response(
+                {"error": "Only owner or share admins can share this document"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
 
         user_id = request.data.get("user")
         permission = request.data.get("permission", DocumentShare.VIEW_PERMISSION)
 
+        # Reject malformed input before any membership lookup
+        if not user_id or not is_valid_uuid(str(user_id)):
+            return Response(
+                {"error": "A valid user is required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         # Can't share with yourself
         if str(user_id) == str(request.user.id):
             return Response(
@@ -73,107 +122,87 @@ class DocumentShareViewSet(BaseViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Check for existing share
-        existing_share = DocumentShare.objects.filter(
+        # Update existing share in place, without loading it first
+        updated = DocumentShare.objects.filter(
             document=document,
             user_id=user_id,
             deleted_at__isnull=True,
-        ).first()
+        ).update(permission=permission)
 
-        if existing_share:
-            # Update existing share
-            existing_share.permission = permission
-            existing_share.save(update_fields=["permission"])
-            serializer = DocumentShareSerializer(existing_share)
+        if updated:
+            serializer = DocumentShareSerializer(self.list_queryset().get(user_id=user_id))
         else:
             # Create new share
             share = DocumentShare.objects.create(
                 document=document,
                 user_id=user_id,
                 permission=permission,
-                workspace=document.workspace,
+                workspace_id=document.workspace_id,
             )
             serializer = DocumentShareSerializer(share)
 
         # Update document access to SHARED if it was PRIVATE
-        if document.access == Document.PRIVATE_ACCESS:
-            document.access = Document.SHARED_ACCESS
-            document.save(update_fields=["access"])
+        Document.objects.filter(pk=document.pk, access=Document.PRIVATE_ACCESS).update(
+            access=Document.SHARED_ACCESS
+        )
 
         log_document_access(
             document, request.user, DocumentAccessLog.ACCESS_TYPE_SHARE, request,
-            {"shared_with": str(user_id), "permission": permission}
+            {"shared_with": str(user_id), "permission": permission}, defer=True
         )
 
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     def partial_update(self, request, slug, document_id, pk):
-        share = self.get_queryset().get(pk=pk)
+        share = self.get_queryset().annotate(is_admin_share=self.admin_share_exists("document_id")).get(pk=pk)
         document = share.document
 
         # Only owner or share admins can update shares
-        if document.owned_by_id != request.user.id:
-            user_share = DocumentShare.objects.filter(
-                document=document,
-                user=request.user,
-                permission=DocumentShare.ADMIN_PERMISSION,
-                deleted_at__isnull=True,
-            ).first()
-
-            if not user_share:
-                return Response(
-                    {"error": "Only owner or share admins can modify shares"},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
+        if document.owned_by_id != request.user.id and not share.is_admin_share:
+            return Response(
+                {"error": "Only owner or share admins can modify shares"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
 
         permission = request.data.get("permission")
         if permission is not None:
+            DocumentShare.objects.filter(pk=share.pk).update(permission=permission)
             share.permission = permission
-            share.save(update_fields=["permission"])
 
         serializer = DocumentShareSerializer(share)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def destroy(self, request, slug, document_id, pk):
-        share = self.get_queryset().get(pk=pk)
+        share = self.get_queryset().annotate(is_admin_share=self.admin_share_exists("document_id")).get(pk=pk)
         document = share.document
 
         # Only owner or share admins can remove shares
-        if document.owned_by_id != request.user.id:
-            user_share = DocumentShare.objects.filter(
-                document=document,
-                user=request.user,
-                permission=DocumentShare.ADMIN_PERMISSION,
-                deleted_at__isnull=True,
-            ).first()
-
-            if not user_share:
-                return Response(
-                    {"error": "Only owner or share admins can remove shares"},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
+        if document.owned_by_id != request.user.id and not share.is_admin_share:
+            return Response(
+                {"error": "Only owner or share admins can remove shares"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
 
         removed_user_id = str(share.user_id)
         share.delete()
 
         # If no more shares, set document back to private
         remaining_shares = DocumentShare.objects.filter(
-            document=document,
+            document=OuterRef("pk"),
             deleted_at__isnull=True,
-        ).count()
-
-        if remaining_shares == 0 and document.access == Document.SHARED_ACCESS:
-            document.access = Document.PRIVATE_ACCESS
-            document.save(update_fields=["access"])
+        ).exclude(pk=pk)
+        Document.objects.filter(pk=document.pk, access=Document.SHARED_ACCESS).filter(
+            ~Exists(remaining_shares)
+        ).update(access=Document.PRIVATE_ACCESS)
 
         log_document_access(
             document, request.user, DocumentAccessLog.ACCESS_TYPE_UNSHARE, request,
-            {"removed_user": removed_user_id}
+            {"removed_user": removed_user_id}, defer=True
         )
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def list(self, request, slug, document_id):
-        shares = self.get_queryset()
+        shares = self.list_queryset()
         serializer = DocumentShareSerializer(shares, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
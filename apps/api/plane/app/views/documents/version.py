@@ -1,19 +1,52 @@
+# Python imports
+import uuid
+
+# Django imports
+from django.db import connection, transaction
+from django.db.models import Count, OuterRef, Subquery, Window
+
 # Third party imports
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 
 # Package imports
-from plane.app.permissions import DocumentPermission
+from plane.app.permissions import DocumentPermission, ROLE, get_workspace_role
 from plane.app.serializers import DocumentVersionSerializer, DocumentVersionDetailSerializer
-from plane.db.models import Document, DocumentVersion, DocumentShare, DocumentAccessLog, WorkspaceMember
-from django.db.models import Q
+from plane.db.models import Document, DocumentVersion, DocumentShare, DocumentAccessLog
 
 # Local imports
 from ..base import BaseViewSet
 from .document import log_document_access
 
 
+def snapshot_and_restore_document(document_id, version_id, user_id):
+    """
+    Save a document's current content as a new version, then overwrite it
+    with the content of another version. Both copies run in SQL so the
+    content never travels through the app server.
+    """
+    snapshot_sql = """
+    INSERT INTO document_versions (
+        id, created_at, updated_at, created_by_id, workspace_id, document_id, owned_by_id, last_saved_at,
+        description_binary, description_html, description_stripped, description_json
+    )
+    SELECT %s, now(), now(), %s, workspace_id, id, %s, now(),
+        description_binary, description_html, description_stripped, description
+    FROM documents WHERE id = %s;
+    """
+    restore_sql = """
+    UPDATE documents SET (description_binary, description_html, description_stripped, description) = (
+        SELECT description_binary, description_html, description_stripped, description_json
+        FROM document_versions WHERE id = %s AND document_id = %s AND deleted_at IS NULL
+    )
+    WHERE id = %s;
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(snapshot_sql, [uuid.uuid4(), user_id, user_id, document_id])
+        cursor.execute(restore_sql, [version_id, document_id, document_id])
+
+
 class DocumentVersionViewSet(BaseViewSet):
     """
     ViewSet for document version history.
@@ -25,34 +58,46 @@ class DocumentVersionViewSet(BaseViewSet):
     permission_classes = [DocumentPermission]
 
     def get_document(self, slug, document_id):
-        user = self.request.user
+        """
+        Get the document if the user can access it, memoized for the request.
+        The user's share permission is resolved in the same query and the
+        workspace role is reused from the permission check, so callers need
+        no further authorization lookups.
+        """
+        if hasattr(self, "_document"):
+            return self._document
 
-        # Check if user is admin
-        is_admin = WorkspaceMember.objects.filter(
-            member=user,
-            workspace__slug=slug,
-            role=20,
-            is_active=True,
-        ).exists()
-
-        base_query = Document.objects.filter(
-            pk=document_id,
-            workspace__slug=slug,
-            deleted_at__isnull=True,
+        user = self.request.user
+        document = (
+            Document.objects.filter(
+                pk=document_id,
+                workspace__slug=slug,
+                deleted_at__isnull=True,
+            )
+            # Restore copies content in SQL, so no handler reads it here
+            .defer("description", "description_binary", "description_html", "description_stripped")
+            .annotate(
+                share_permission=Subquery(
+                    DocumentShare.objects.filter(
+                        document=OuterRef("pk"),
+                        user=user,
+                        deleted_at__isnull=True,
+                    ).values("permission")[:1]
+                ),
+            )
+            .first()
         )
 
-        if is_admin:
-            return base_query.first()
+        # Admins see everything, others need ownership or a share
+        if document and not (
+            get_workspace_role(self.request, slug) == ROLE.ADMIN.value
+            or document.owned_by_id == user.id
+            or document.share_permission is not None
+        ):
+            document = None
 
-        # Check access
-        shared_documents = DocumentShare.objects.filter(
-            user=user,
-            deleted_at__isnull=True,
-        ).values_list("document_id", flat=True)
-
-        return base_query.filter(
-            Q(owned_by=user) | Q(id__in=shared_documents)
-        ).first()
+        self._document = document
+        return document
 
     def get_queryset(self):
         return DocumentVersion.objects.filter(
@@ -72,8 +117,13 @@ class DocumentVersionViewSet(BaseViewSet):
         limit = int(request.query_params.get("limit", 20))
         offset = int(request.query_params.get("offset", 0))
 
-        total = versions.count()
-        versions = versions[offset : offset + limit]
+        # Fetch the page and the total in one query via COUNT(*) OVER ()
+        versions = list(versions.annotate(total_count=Window(expression=Count("id")))[offset : offset + limit])
+        if versions:
+            total = versions[0].total_count
+        else:
+            # Past the last page the window yields no rows to read the total from
+            total = self.get_queryset().count() if offset else 0
 
         serializer = DocumentVersionSerializer(versions, many=True)
         return Response(
@@ -104,43 +154,28 @@ class DocumentVersionViewSet(BaseViewSet):
             return Response({"error": "Document not found"}, status=status.HTTP_404_NOT_FOUND)
 
         # Check edit permission
-        if document.owned_by_id != request.user.id:
-            share = DocumentShare.objects.filter(
-                document=document,
-                user=request.user,
-                permission__in=[DocumentShare.EDIT_PERMISSION, DocumentShare.ADMIN_PERMISSION],
-                deleted_at__isnull=True,
-            ).first()
-
-            if not share:
-                return Response(
-                    {"error": "You don't have permission to restore this document"},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
-
-        version = self.get_queryset().filter(pk=pk).first()
-        if not version:
-            return Response({"error": "Version not found"}, status=status.HTTP_404_NOT_FOUND)
-
-        # Create a new version with current state before restoring
-        DocumentVersion.objects.create(
-            workspace=document.workspace,
-            document=document,
-            owned_by=request.user,
-            description_binary=document.description_binary,
-            description_html=document.description_html,
-            description_json=document.description,
-        )
-
-        # Restore the document content
-        document.description_binary = version.description_binary
-        document.description_html = version.description_html
-        document.description = version.description_json
-        document.save(update_fields=["description_binary", "description_html", "description"])
+        if document.owned_by_id != request.user.id and document.share_permission not in (
+            DocumentShare.EDIT_PERMISSION,
+            DocumentShare.ADMIN_PERMISSION,
+        ):
+            return Response(
+                {"error": "You don't have permission to restore this document"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        with transaction.atomic():
+            # Lock the version so it cannot be deleted between the check and the copy
+            version_exists = (
+                self.get_queryset().select_related(None).select_for_update().filter(pk=pk).exists()
+            )
+            if not version_exists:
+                return Response({"error": "Version not found"}, status=status.HTTP_404_NOT_FOUND)
+
+            snapshot_and_restore_document(document.id, pk, request.user.id)
 
         log_document_access(
             document, request.user, DocumentAccessLog.ACCESS_TYPE_EDIT, request,
-            {"action": "restore", "restored_version_id": str(pk)}
+            {"action": "restore", "restored_version_id": str(pk)}, defer=True
         )
 
         return Response({"message": "Version restored successfully"}, status=status.HTTP_200_OK)
@@ -12,7 +12,19 @@ from rest_framework.response import Response
 
 from plane.app.permissions import ROLE, allow_permission
 from plane.app.views.base import BaseAPIView
-from plane.db.models import User, Profile, Workspace, WorkspaceMember
+from plane.db.models import (
+    User,
+    Profile,
+    UserNotificationPreference,
+    Workspace,
+    WorkspaceMember,
+)
+
+
+# Settings and environment are fixed for the life of the process
+_DEBUG = settings.DEBUG
+_DEV_ENDPOINTS_ENV = os.environ.get("PLANE_DEV_ENDPOINTS", "").lower() in ("1", "true")
+_LOCALHOSTS = frozenset({"127.0.0.1", "::1", "localhost"})
 
 
 def is_dev_mode(request=None):
@@ -26,24 +38,18 @@ def is_dev_mode(request=None):
     accidentally set in production, it won't work because requests won't
     come from localhost.
     """
-    if settings.DEBUG:
+    if _DEBUG:
         return True
 
-    dev_endpoints = os.environ.get("PLANE_DEV_ENDPOINTS", "").lower()
-    if dev_endpoints not in ("1", "true"):
+    if not _DEV_ENDPOINTS_ENV:
         return False
 
     # Extra safety: only allow if request is from localhost
-    if request:
-        remote_addr = request.META.get("REMOTE_ADDR", "")
-        if remote_addr not in ("127.0.0.1", "::1", "localhost"):
-            return False
-
-    return True
+    return request is None or request.META.get("REMOTE_ADDR", "") in _LOCALHOSTS
 
 
 # Realistic first names for fake users
-FIRST_NAMES = [
+FIRST_NAMES = (
     "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda",
     "David", "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
     "Thomas", "Sarah", "Christopher", "Karen", "Charles", "Lisa", "Daniel", "Nancy",
@@ -54,10 +60,10 @@ FIRST_NAMES = [
     "Jeffrey", "Laura", "Ryan", "Cynthia", "Jacob", "Kathleen", "Gary", "Amy",
     "Nicholas", "Angela", "Eric", "Shirley", "Jonathan", "Anna", "Stephen", "Brenda",
     "Larry", "Pamela", "Justin", "Emma", "Scott", "Nicole", "Brandon", "Helen",
-]
+)
 
 # Realistic last names for fake users
-LAST_NAMES = [
+LAST_NAMES = (
     "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
     "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas",
     "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson", "White",
@@ -68,7 +74,7 @@ LAST_NAMES = [
     "Stewart", "Murphy", "Cook", "Rogers", "Morgan", "Peterson", "Cooper", "Reed",
     "Bailey", "Bell", "Gomez", "Kelly", "Howard", "Ward", "Cox", "Diaz",
     "Richardson", "Wood", "Watson", "Brooks", "Bennett", "Gray", "James", "Reyes",
-]
+)
 
 
 class GenerateFakeMembersEndpoint(BaseAPIView):
@@ -100,54 +106,68 @@ class GenerateFakeMembersEndpoint(BaseAPIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        created_users = []
-
-        with transaction.atomic():
-            for i in range(count):
-                # Generate unique identifier
-                unique_id = uuid.uuid4().hex[:8]
-
-                # Pick random names
-                first_name = random.choice(FIRST_NAMES)
-                last_name = random.choice(LAST_NAMES)
-
-                # Create email with unique identifier to avoid collisions
-                email = f"fake-{unique_id}@example.dev"
-                username = f"fake-user-{unique_id}"
-                display_name = f"{first_name} {last_name}"
-
-                # Create the user
-                user = User.objects.create(
-                    email=email,
-                    username=username,
+        # Pre-generate unique identifiers in a single pass
+        unique_ids = set()
+        while len(unique_ids) < count:
+            unique_ids.add(uuid.uuid4().hex[:8])
+
+        # Pick random names
+        first_names = random.choices(FIRST_NAMES, k=count)
+        last_names = random.choices(LAST_NAMES, k=count)
+
+        users = []
+        for unique_id, first_name, last_name in zip(unique_ids, first_names, last_names):
+            # Create email with unique identifier to avoid collisions
+            users.append(
+                User(
+                    email=f"fake-{unique_id}@example.dev",
+                    username=f"fake-user-{unique_id}",
                     first_name=first_name,
                     last_name=last_name,
-                    display_name=display_name,
+                    display_name=f"{first_name} {last_name}",
                     is_active=True,
                     is_email_verified=True,
                     is_password_autoset=True,  # Mark as no password set
                 )
+            )
 
-                # Create associated profile
-                Profile.objects.create(
-                    user=user,
-                    is_onboarded=True,
-                )
+        with transaction.atomic():
+            User.objects.bulk_create(users)
+
+            # bulk_create skips the post_save signal, so create the
+            # notification preferences it would have added
+            UserNotificationPreference.objects.bulk_create(
+                [
+                    UserNotificationPreference(
+                        user=user,
+                        property_change=True,
+                        state_change=True,
+                        comment=True,
+                        mention=True,
+                        issue_completed=True,
+                    )
+                    for user in users
+                ]
+            )
 
-                # Add user to workspace as a Member (role=15)
-                workspace_member = WorkspaceMember.objects.create(
-                    workspace=workspace,
-                    member=user,
-                    role=15,  # Member role
-                )
+            # Create associated profiles
+            Profile.objects.bulk_create([Profile(user=user, is_onboarded=True) for user in users])
 
-                created_users.append({
-                    "id": str(user.id),
-                    "email": user.email,
-                    "display_name": user.display_name,
-                    "first_name": user.first_name,
-                    "last_name": user.last_name,
-                })
+            # Add users to workspace as Members (role=15)
+            WorkspaceMember.objects.bulk_create(
+                [WorkspaceMember(workspace=workspace, member=user, role=15) for user in users]
+            )
+
+        created_users = [
+            {
+                "id": str(user.id),
+                "email": user.email,
+                "display_name": user.display_name,
+                "first_name": user.first_name,
+                "last_name": user.last_name,
+            }
+            for user in users
+        ]
 
         return Response(
             {
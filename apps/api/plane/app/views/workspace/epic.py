@@ -1,5 +1,8 @@
+# Python imports
+from collections import defaultdict
+
 # Django imports
-from django.db.models import Prefetch, Q, Count
+from django.db.models import Count
 
 # Third party epics
 from rest_framework import status
@@ -7,101 +10,81 @@ from rest_framework.response import Response
 
 # Package imports
 from plane.app.views.base import BaseAPIView
-from plane.db.models import Epic, EpicLink
+from plane.db.models import Epic, EpicIssue
 from plane.app.permissions import WorkspaceViewerPermission
 from plane.app.serializers.epic import EpicSerializer
 
 
+# Epic columns rendered by EpicSerializer; relations are exposed by id only
+EPIC_LIST_FIELDS = (
+    "id",
+    "workspace_id",
+    "project_id",
+    "name",
+    "description",
+    "description_text",
+    "description_html",
+    "start_date",
+    "target_date",
+    "status",
+    "lead_id",
+    "view_props",
+    "sort_order",
+    "external_source",
+    "external_id",
+    "logo_props",
+    "created_at",
+    "updated_at",
+    "archived_at",
+)
+
+
+# State groups reported per epic, keyed by the serializer's count field
+EPIC_STATE_GROUP_FIELDS = {
+    "completed": "completed_issues",
+    "cancelled": "cancelled_issues",
+    "started": "started_issues",
+    "unstarted": "unstarted_issues",
+    "backlog": "backlog_issues",
+}
+
+
+def attach_epic_issue_counts(epics):
+    """Set per state group issue counts on each epic from one grouped query."""
+    counts = defaultdict(dict)
+    rollup = (
+        EpicIssue.objects.filter(
+            epic_id__in=[epic.id for epic in epics],
+            deleted_at__isnull=True,
+            issue__archived_at__isnull=True,
+            issue__is_draft=False,
+        )
+        .values("epic_id", "issue__state__group")
+        .annotate(cnt=Count("pk"))
+    )
+    for row in rollup:
+        counts[row["epic_id"]][row["issue__state__group"]] = row["cnt"]
+
+    for epic in epics:
+        groups = counts.get(epic.id, {})
+        epic.total_issues = sum(groups.values())
+        for group, field in EPIC_STATE_GROUP_FIELDS.items():
+            setattr(epic, field, groups.get(group, 0))
+    return epics
+
+
 class WorkspaceEpicsEndpoint(BaseAPIView):
     permission_classes = [WorkspaceViewerPermission]
 
     def get(self, request, slug):
         epics = (
             Epic.objects.filter(workspace__slug=slug)
-            .select_related("project")
-            .select_related("workspace")
-            .select_related("lead")
             .prefetch_related("members")
             .filter(archived_at__isnull=True)
-            .prefetch_related(
-                Prefetch(
-                    "link_epic",
-                    queryset=EpicLink.objects.select_related("epic", "created_by"),
-                )
-            )
-            .annotate(
-                total_issues=Count(
-                    "issue_epic",
-                    filter=Q(
-                        issue_epic__issue__archived_at__isnull=True,
-                        issue_epic__issue__is_draft=False,
-                        issue_epic__deleted_at__isnull=True,
-                    ),
-                    distinct=True,
-                )
-            )
-            .annotate(
-                completed_issues=Count(
-                    "issue_epic__issue__state__group",
-                    filter=Q(
-                        issue_epic__issue__state__group="completed",
-                        issue_epic__issue__archived_at__isnull=True,
-                        issue_epic__issue__is_draft=False,
-                        issue_epic__deleted_at__isnull=True,
-                    ),
-                    distinct=True,
-                )
-            )
-            .annotate(
-                cancelled_issues=Count(
-                    "issue_epic__issue__state__group",
-                    filter=Q(
-                        issue_epic__issue__state__group="cancelled",
-                        issue_epic__issue__archived_at__isnull=True,
-                        issue_epic__issue__is_draft=False,
-                        issue_epic__deleted_at__isnull=True,
-                    ),
-                    distinct=True,
-                )
-            )
-            .annotate(
-                started_issues=Count(
-                    "issue_epic__issue__state__group",
-                    filter=Q(
-                        issue_epic__issue__state__group="started",
-                        issue_epic__issue__archived_at__isnull=True,
-                        issue_epic__issue__is_draft=False,
-                        issue_epic__deleted_at__isnull=True,
-                    ),
-                    distinct=True,
-                )
-            )
-            .annotate(
-                unstarted_issues=Count(
-                    "issue_epic__issue__state__group",
-                    filter=Q(
-                        issue_epic__issue__state__group="unstarted",
-                        issue_epic__issue__archived_at__isnull=True,
-                        issue_epic__issue__is_draft=False,
-                        issue_epic__deleted_at__isnull=True,
-                    ),
-                    distinct=True,
-                )
-            )
-            .annotate(
-                backlog_issues=Count(
-                    "issue_epic__issue__state__group",
-                    filter=Q(
-                        issue_epic__issue__state__group="backlog",
-                        issue_epic__issue__archived_at__isnull=True,
-                        issue_epic__issue__is_draft=False,
-                        issue_epic__deleted_at__isnull=True,
-                    ),
-                    distinct=True,
-                )
-            )
+            .only(*EPIC_LIST_FIELDS)
             .order_by(self.kwargs.get("order_by", "-created_at"))
         )
+        epics = attach_epic_issue_counts(list(epics))
 
         serializer = EpicSerializer(epics, many=True).data
         return Response(serializer, status=status.HTTP_200_OK)
@@ -1,11 +1,15 @@
 # Python imports
+import base64
 from datetime import timedelta
+from functools import partial
 import secrets
 import uuid
 
 # Django imports
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
+from django.db import transaction
+from django.db.models import Case, CharField, IntegerField, Value, When
 from django.utils import timezone
 
 # Third party epics
@@ -14,7 +18,7 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 # Package imports
-from plane.app.permissions import WorkSpaceAdminPermission
+from plane.app.permissions import WorkSpaceAdminPermission, get_workspace_membership
 from plane.app.serializers import (
     WorkSpaceMemberInviteSerializer,
     WorkSpaceMemberSerializer,
@@ -22,27 +26,47 @@ from plane.app.serializers import (
 from plane.app.views.base import BaseAPIView
 from plane.bgtasks.event_tracking_task import workspace_invite_event
 from plane.bgtasks.workspace_invitation_task import workspace_invitation
-from plane.db.models import User, Workspace, WorkspaceMember, WorkspaceMemberInvite, UserStatusChoices, Profile
+from plane.db.models import (
+    User,
+    WorkspaceMember,
+    WorkspaceMemberInvite,
+    UserStatusChoices,
+    Profile,
+    UserNotificationPreference,
+)
 from plane.utils.cache import invalidate_cache, invalidate_cache_directly
 from plane.utils.host import base_host
 from plane.utils.ip_address import get_client_ip
 from .. import BaseViewSet
 
+# Invitation emails sent per broker message
+INVITATION_EMAIL_CHUNK_SIZE = 10
+
+# Entropy per invitation token, matching secrets.token_urlsafe(32)
+INVITATION_TOKEN_BYTES = 32
+
 
-def generate_unique_username(email):
-    """Generate a unique username from email, adding UUID suffix if needed."""
-    prefix = email.split("@")[0]
-    # Start with just the prefix
-    username = prefix
-    # If it already exists, add a UUID suffix
-    if User.objects.filter(username=username).exists():
-        username = f"{prefix}_{uuid.uuid4().hex[:8]}"
-    return username
+def generate_unique_usernames(emails):
+    """Generate unique usernames from emails, adding UUID suffix where needed."""
+    prefixes = [email.split("@")[0] for email in emails]
+    # Look up every candidate prefix at once
+    taken = set(User.objects.filter(username__in=prefixes).values_list("username", flat=True))
+    usernames = []
+    for prefix in prefixes:
+        # If it already exists, or an earlier email in the batch claimed it, add a UUID suffix
+        username = f"{prefix}_{uuid.uuid4().hex[:8]}" if prefix in taken else prefix
+        taken.add(username)
+        usernames.append(username)
+    return usernames
 
 
-def generate_invitation_token():
-    """Generate a secure invitation token."""
-    return secrets.token_urlsafe(32)
+def generate_invitation_tokens(count):
+    """Generate secure invitation tokens, drawing the entropy for all of them at once."""
+    raw = secrets.token_bytes(INVITATION_TOKEN_BYTES * count)
+    return [
+        base64.urlsafe_b64encode(raw[offset : offset + INVITATION_TOKEN_BYTES]).rstrip(b"=").decode("ascii")
+        for offset in range(0, len(raw), INVITATION_TOKEN_BYTES)
+    ]
 
 
 class WorkspaceInvitationsViewset(BaseViewSet):
@@ -58,7 +82,8 @@ class WorkspaceInvitationsViewset(BaseViewSet):
             super()
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
-            .select_related("workspace", "workspace__owner", "created_by")
+            # The serializer renders workspace name, slug and logo_url; created_by is rendered by id
+            .select_related("workspace", "workspace__logo_asset")
         )
 
     def create(self, request, slug):
@@ -67,133 +92,206 @@ class WorkspaceInvitationsViewset(BaseViewSet):
         if not emails:
             return Response({"error": "Emails are required"}, status=status.HTTP_400_BAD_REQUEST)
 
-        # check for role level of the requesting user
-        requesting_user = WorkspaceMember.objects.get(workspace__slug=slug, member=request.user, is_active=True)
+        # Validate every email before touching the database
+        roles = {}
+        for email_data in emails:
+            try:
+                email = email_data.get("email").strip().lower()
+                validate_email(email)
+            except ValidationError:
+                return Response(
+                    {
+                        "error": f"Invalid email - {email_data} provided a valid email address is required to send the invite"  # noqa: E501
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            roles[email] = email_data.get("role", 5)
+
+        # check for role level of the requesting user, reusing the lookup the permission check made
+        membership = get_workspace_membership(request, slug)
+        if membership is None:
+            return Response(
+                {"error": "You are not a member of this workspace"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        requesting_role, workspace_id = membership
 
         # Check if any invited user has an higher role
-        if len([email for email in emails if int(email.get("role", 5)) > requesting_user.role]):
+        if any(int(email.get("role", 5)) > requesting_role for email in emails):
             return Response(
                 {"error": "You cannot invite a user with higher role"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Get the workspace object
-        workspace = Workspace.objects.get(slug=slug)
-
         # Check if user is already an active member of workspace
         workspace_members = WorkspaceMember.objects.filter(
-            workspace_id=workspace.id,
-            member__email__in=[email.get("email") for email in emails],
+            workspace_id=workspace_id,
+            member__email__in=list(roles),
             member__status=UserStatusChoices.ACTIVE,
             is_active=True,
-        ).select_related("member", "member__avatar_asset")
+        )
 
-        if workspace_members:
+        # Only load the member details when there is a conflict to report
+        if workspace_members.exists():
             return Response(
                 {
                     "error": "Some users are already member of workspace",
-                    "workspace_users": WorkSpaceMemberSerializer(workspace_members, many=True).data,
+                    "workspace_users": WorkSpaceMemberSerializer(
+                        workspace_members.select_related("member", "member__avatar_asset"), many=True
+                    ).data,
                 },
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
         current_site = base_host(request=request, is_app=True)
-        invited_users = []
 
-        for email_data in emails:
-            try:
-                email = email_data.get("email").strip().lower()
-                validate_email(email)
-                role = email_data.get("role", 5)
-
-                # Check if user already exists
-                existing_user = User.objects.filter(email=email).first()
-
-                if existing_user:
-                    if existing_user.status == UserStatusChoices.ACTIVE:
-                        # User is already active - they need to be added via different flow
-                        # This shouldn't happen due to the check above, but handle gracefully
-                        continue
-                    elif existing_user.status == UserStatusChoices.INVITED:
-                        # Resend invitation - refresh token and expiry
-                        existing_user.invitation_token = generate_invitation_token()
-                        existing_user.invitation_expires_at = timezone.now() + timedelta(days=14)
-                        existing_user.save(update_fields=['invitation_token', 'invitation_expires_at'])
-                        user = existing_user
-                    else:
-                        # Deactivated user - reactivate as invited
-                        existing_user.status = UserStatusChoices.INVITED
-                        existing_user.invited_at = timezone.now()
-                        existing_user.invited_by = request.user
-                        existing_user.invitation_token = generate_invitation_token()
-                        existing_user.invitation_expires_at = timezone.now() + timedelta(days=14)
-                        existing_user.save(update_fields=[
-                            'status', 'invited_at', 'invited_by',
-                            'invitation_token', 'invitation_expires_at'
-                        ])
-                        user = existing_user
+        # Fetch all existing users in one query
+        existing_users = User.objects.filter(email__in=list(roles)).in_bulk(field_name="email")
+
+        now = timezone.now()
+        invitation_expires_at = now + timedelta(days=14)
+        invitation_tokens = iter(generate_invitation_tokens(len(roles)))
+        invited_users = []
+        resent_users = []
+        reactivated_users = []
+        new_users = []
+
+        for email in roles:
+            existing_user = existing_users.get(email)
+
+            if existing_user:
+                if existing_user.status == UserStatusChoices.ACTIVE:
+                    # User is already active - they need to be added via different flow
+                    # This shouldn't happen due to the check above, but handle gracefully
+                    continue
+                elif existing_user.status == UserStatusChoices.INVITED:
+                    # Resend invitation - refresh token and expiry
+                    existing_user.invitation_token = next(invitation_tokens)
+                    existing_user.invitation_expires_at = invitation_expires_at
+                    resent_users.append(existing_user)
                 else:
-                    # Create shadow user
-                    user = User.objects.create(
-                        email=email,
-                        username=generate_unique_username(email),
-                        display_name=email,  # Use full email as display name until user sets their own
-                        status=UserStatusChoices.INVITED,
-                        invited_at=timezone.now(),
-                        invited_by=request.user,
-                        invitation_token=generate_invitation_token(),
-                        invitation_expires_at=timezone.now() + timedelta(days=14),
-                        is_active=False,  # Cannot login until invitation accepted
-                    )
-                    # Create profile for shadow user
-                    Profile.objects.create(user=user)
-
-                # Create or update workspace membership
-                workspace_member, created = WorkspaceMember.objects.get_or_create(
-                    workspace=workspace,
-                    member=user,
-                    defaults={
-                        'role': role,
-                        'created_by': request.user,
-                    }
+                    # Deactivated user - reactivate as invited
+                    existing_user.status = UserStatusChoices.INVITED
+                    existing_user.invited_at = now
+                    existing_user.invited_by = request.user
+                    existing_user.invitation_token = next(invitation_tokens)
+                    existing_user.invitation_expires_at = invitation_expires_at
+                    reactivated_users.append(existing_user)
+                invited_users.append(existing_user)
+            else:
+                # Create shadow user
+                user = User(
+                    email=email,
+                    display_name=email,  # Use full email as display name until user sets their own
+                    status=UserStatusChoices.INVITED,
+                    invited_at=now,
+                    invited_by=request.user,
+                    invitation_token=next(invitation_tokens),
+                    invitation_expires_at=invitation_expires_at,
+                    is_active=False,  # Cannot login until invitation accepted
                 )
-                if not created:
-                    # Update existing membership
-                    workspace_member.role = role
-                    workspace_member.is_active = True
-                    workspace_member.save(update_fields=['role', 'is_active'])
-
+                new_users.append(user)
                 invited_users.append(user)
 
-                # Also create WorkspaceMemberInvite for backward compatibility with email task
-                # TODO: Remove this once email task is updated to use User.invitation_token
-                WorkspaceMemberInvite.objects.update_or_create(
-                    email=email,
-                    workspace=workspace,
-                    defaults={
-                        'token': user.invitation_token,
-                        'role': role,
-                        'created_by': request.user,
-                    }
-                )
+        for user, username in zip(new_users, generate_unique_usernames([user.email for user in new_users])):
+            user.username = username
 
-            except ValidationError:
-                return Response(
-                    {
-                        "error": f"Invalid email - {email_data} provided a valid email address is required to send the invite"  # noqa: E501
-                    },
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
+        with transaction.atomic():
+            User.objects.bulk_update(resent_users, ["invitation_token", "invitation_expires_at"])
+            User.objects.bulk_update(
+                reactivated_users,
+                ["status", "invited_at", "invited_by", "invitation_token", "invitation_expires_at"],
+            )
 
-        # Send invitations
-        for user in invited_users:
-            workspace_invitation.delay(
-                user.email,
-                workspace.id,
-                user.invitation_token,
-                current_site,
-                request.user.email,
+            User.objects.bulk_create(new_users)
+            # bulk_create skips the post_save signal, so create the
+            # notification preferences it would have added
+            UserNotificationPreference.objects.bulk_create(
+                [
+                    UserNotificationPreference(
+                        user=user,
+                        property_change=True,
+                        state_change=True,
+                        comment=True,
+                        mention=True,
+                        issue_completed=True,
+                    )
+                    for user in new_users
+                ]
             )
+            # Create profiles for shadow users
+            Profile.objects.bulk_create([Profile(user=user) for user in new_users])
+
+            # Create or update workspace memberships
+            workspace_members = {
+                workspace_member.member_id: workspace_member
+                for workspace_member in WorkspaceMember.objects.filter(
+                    workspace_id=workspace_id,
+                    member__in=invited_users,
+                ).only("id", "member_id")
+            }
+            updated_members = []
+            new_members = []
+            for user in invited_users:
+                workspace_member = workspace_members.get(user.id)
+                if workspace_member:
+                    workspace_member.role = roles[user.email]
+                    workspace_member.is_active = True
+                    updated_members.append(workspace_member)
+                else:
+                    new_members.append(
+                        WorkspaceMember(
+                            workspace_id=workspace_id,
+                            member=user,
+                            role=roles[user.email],
+                            created_by=request.user,
+                        )
+                    )
+            WorkspaceMember.objects.bulk_update(updated_members, ["role", "is_active"])
+            WorkspaceMember.objects.bulk_create(new_members)
+
+            # Also create WorkspaceMemberInvite for backward compatibility with email task
+            # TODO: Remove this once email task is updated to use User.invitation_token
+            workspace_invites = {
+                workspace_invite.email: workspace_invite
+                for workspace_invite in WorkspaceMemberInvite.objects.filter(
+                    workspace_id=workspace_id,
+                    email__in=[user.email for user in invited_users],
+                ).only("id", "email")
+            }
+            updated_invites = []
+            new_invites = []
+            for user in invited_users:
+                workspace_invite = workspace_invites.get(user.email)
+                if workspace_invite:
+                    workspace_invite.token = user.invitation_token
+                    workspace_invite.role = roles[user.email]
+                    workspace_invite.created_by = request.user
+                    updated_invites.append(workspace_invite)
+                else:
+                    new_invites.append(
+                        WorkspaceMemberInvite(
+                            email=user.email,
+                            workspace_id=workspace_id,
+                            token=user.invitation_token,
+                            role=roles[user.email],
+                            created_by=request.user,
+                        )
+                    )
+            WorkspaceMemberInvite.objects.bulk_update(updated_invites, ["token", "role", "created_by"])
+            WorkspaceMemberInvite.objects.bulk_create(new_invites)
+
+            # Send invitations once the writes are committed, batching broker messages
+            if invited_users:
+                transaction.on_commit(
+                    workspace_invitation.chunks(
+                        [
+                            (user.email, workspace_id, user.invitation_token, current_site, request.user.email)
+                            for user in invited_users
+                        ],
+                        INVITATION_EMAIL_CHUNK_SIZE,
+                    ).apply_async
+                )
 
         return Response({"message": "Emails sent successfully"}, status=status.HTTP_200_OK)
 
@@ -210,12 +308,18 @@ class WorkspaceInvitationsViewset(BaseViewSet):
             # Import here to avoid circular imports
             from plane.db.models import Project, Issue
 
-            # Check for assignments that would be orphaned
-            assignments = []
-            if Project.objects.filter(project_lead=shadow_user).exists():
-                assignments.append("project lead")
-            if Issue.objects.filter(assignees=shadow_user).exists():
-                assignments.append("issue assignee")
+            # Check for assignments that would be orphaned, both kinds in one round trip
+            found = set(
+                Project.objects.filter(project_lead=shadow_user)
+                .order_by()
+                .values_list(Value("project lead", output_field=CharField()), flat=True)[:1]
+                .union(
+                    Issue.objects.filter(assignees=shadow_user)
+                    .order_by()
+                    .values_list(Value("issue assignee", output_field=CharField()), flat=True)[:1]
+                )
+            )
+            assignments = [assignment for assignment in ("project lead", "issue assignee") if assignment in found]
 
             if assignments:
                 return Response(
@@ -256,7 +360,9 @@ class WorkspaceJoinEndpoint(BaseAPIView):
     )
     @invalidate_cache(path="/api/users/me/settings/", multiple=True)
     def post(self, request, slug, pk):
-        workspace_invite = WorkspaceMemberInvite.objects.get(pk=pk, workspace__slug=slug)
+        workspace_invite = WorkspaceMemberInvite.objects.only(
+            "id", "email", "accepted", "responded_at", "role", "workspace_id", "updated_at", "updated_by"
+        ).get(pk=pk, workspace__slug=slug)
 
         email = request.data.get("email", "")
 
@@ -269,73 +375,75 @@ class WorkspaceJoinEndpoint(BaseAPIView):
 
         # If already responded then return error
         if workspace_invite.responded_at is None:
-            workspace_invite.accepted = request.data.get("accepted", False)
-            workspace_invite.responded_at = timezone.now()
-            workspace_invite.save()
-
-            if workspace_invite.accepted:
-                # With shadow user pattern, user should already exist
-                user = User.objects.filter(email=email).first()
-
-                if user is not None:
-                    # Activate the shadow user if they were invited
-                    if user.status == UserStatusChoices.INVITED:
-                        user.status = UserStatusChoices.ACTIVE
-                        user.activated_at = timezone.now()
-                        user.invitation_token = None
-                        user.invitation_expires_at = None
-                        user.is_active = True  # Enable login
-                        user.save(update_fields=[
-                            'status', 'activated_at', 'invitation_token',
-                            'invitation_expires_at', 'is_active'
-                        ])
-
-                    # Ensure workspace membership exists and is active
-                    workspace_member = WorkspaceMember.objects.filter(
-                        workspace=workspace_invite.workspace, member=user
-                    ).first()
-                    if workspace_member is not None:
-                        workspace_member.is_active = True
-                        workspace_member.role = workspace_invite.role
-                        workspace_member.save()
-                    else:
-                        # Create workspace membership (shouldn't happen with shadow users, but handle gracefully)
-                        WorkspaceMember.objects.create(
-                            workspace=workspace_invite.workspace,
-                            member=user,
-                            role=workspace_invite.role,
+            with transaction.atomic():
+                workspace_invite.accepted = request.data.get("accepted", False)
+                workspace_invite.responded_at = timezone.now()
+                workspace_invite.save()
+
+                if workspace_invite.accepted:
+                    # With shadow user pattern, user should already exist
+                    user = User.objects.filter(email=email).first()
+
+                    if user is not None:
+                        # Activate the shadow user if they were invited
+                        if user.status == UserStatusChoices.INVITED:
+                            user.status = UserStatusChoices.ACTIVE
+                            user.activated_at = timezone.now()
+                            user.invitation_token = None
+                            user.invitation_expires_at = None
+                            user.is_active = True  # Enable login
+                            user.save(update_fields=[
+                                'status', 'activated_at', 'invitation_token',
+                                'invitation_expires_at', 'is_active'
+                            ])
+
+                        # Ensure workspace membership exists and is active
+                        updated_members = WorkspaceMember.objects.filter(
+                            workspace_id=workspace_invite.workspace_id, member=user
+                        ).update(is_active=True, role=workspace_invite.role)
+                        if not updated_members:
+                            # Create workspace membership (shouldn't happen with shadow users, but handle gracefully)
+                            WorkspaceMember.objects.create(
+                                workspace_id=workspace_invite.workspace_id,
+                                member=user,
+                                role=workspace_invite.role,
+                            )
+
+                        # Set the user last_workspace_id to the accepted workspace
+                        # Create the profile if it doesn't exist (legacy edge case)
+                        updated = Profile.objects.filter(user=user).update(
+                            last_workspace_id=workspace_invite.workspace_id
                         )
+                        if not updated:
+                            Profile.objects.create(user=user, last_workspace_id=workspace_invite.workspace_id)
+
+                        # Delete the invitation record (backward compatibility cleanup)
+                        workspace_invite.delete()
+
+                    # Send event once the acceptance is committed
+                    transaction.on_commit(
+                        partial(
+                            workspace_invite_event.delay,
+                            user=user.id if user is not None else None,
+                            email=email,
+                            user_agent=request.META.get("HTTP_USER_AGENT"),
+                            ip=get_client_ip(request=request),
+                            event_name="MEMBER_ACCEPTED",
+                            accepted_from="EMAIL",
+                        )
+                    )
 
-                    # Set the user last_workspace_id to the accepted workspace
-                    # Use get_or_create in case profile doesn't exist (legacy edge case)
-                    profile, _ = Profile.objects.get_or_create(user=user)
-                    profile.last_workspace_id = workspace_invite.workspace.id
-                    profile.save(update_fields=['last_workspace_id'])
-
-                    # Delete the invitation record (backward compatibility cleanup)
-                    workspace_invite.delete()
-
-                # Send event
-                workspace_invite_event.delay(
-                    user=user.id if user is not None else None,
-                    email=email,
-                    user_agent=request.META.get("HTTP_USER_AGENT"),
-                    ip=get_client_ip(request=request),
-                    event_name="MEMBER_ACCEPTED",
-                    accepted_from="EMAIL",
-                )
+                    return Response(
+                        {"message": "Workspace Invitation Accepted"},
+                        status=status.HTTP_200_OK,
+                    )
 
+                # Workspace invitation rejected
                 return Response(
-                    {"message": "Workspace Invitation Accepted"},
+                    {"message": "Workspace Invitation was not accepted"},
                     status=status.HTTP_200_OK,
                 )
 
-            # Workspace invitation rejected
-            return Response(
-                {"message": "Workspace Invitation was not accepted"},
-                status=status.HTTP_200_OK,
-            )
-
         return Response(
             {"error": "You have already responded to the invitation request"},
             status=status.HTTP_400_BAD_REQUEST,
@@ -360,9 +468,12 @@ class UserWorkspaceInvitationsViewSet(BaseViewSet):
     @invalidate_cache(path="/api/users/me/workspaces/", multiple=True)
     def create(self, request):
         invitations = request.data.get("invitations", [])
-        workspace_invitations = WorkspaceMemberInvite.objects.filter(
-            pk__in=invitations, email=request.user.email
-        ).order_by("-created_at")
+        workspace_invitations = (
+            WorkspaceMemberInvite.objects.filter(pk__in=invitations, email=request.user.email)
+            .select_related("workspace")
+            .only("id", "role", "workspace_id", "workspace__slug")
+            .order_by("-created_at")
+        )
 
         # Activate shadow user if status is invited
         user = request.user
@@ -378,17 +489,24 @@ class UserWorkspaceInvitationsViewSet(BaseViewSet):
             ])
 
         # If the user is already a member of workspace and was deactivated then activate the user
-        for invitation in workspace_invitations:
+        roles = {invitation.workspace_id: invitation.role for invitation in workspace_invitations}
+        if roles:
+            # Update the WorkspaceMember rows for every invitation in one statement
+            WorkspaceMember.objects.filter(workspace_id__in=roles, member=request.user).update(
+                is_active=True,
+                role=Case(
+                    *[When(workspace_id=workspace_id, then=Value(role)) for workspace_id, role in roles.items()],
+                    output_field=IntegerField(),
+                ),
+            )
+
+        for workspace_slug in {invitation.workspace.slug for invitation in workspace_invitations}:
             invalidate_cache_directly(
-                path=f"/api/workspaces/{invitation.workspace.slug}/members/",
+                path=f"/api/workspaces/{workspace_slug}/members/",
                 user=False,
                 request=request,
                 multiple=True,
             )
-            # Update the WorkspaceMember for this specific invitation
-            WorkspaceMember.objects.filter(workspace_id=invitation.workspace_id, member=request.user).update(
-                is_active=True, role=invitation.role
-            )
 
         # Bulk create workspace memberships for all workspaces (if not already existing)
         WorkspaceMember.objects.bulk_create(
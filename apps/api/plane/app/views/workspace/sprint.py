@@ -6,6 +6,7 @@ import pytz
 # Django imports
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
+from django.core.cache import cache
 from django.db.models import (
     Case,
     CharField,
@@ -14,8 +15,8 @@ from django.db.models import (
     F,
     Func,
     OuterRef,
-    Prefetch,
     Q,
+    Subquery,
     UUIDField,
     Value,
     When,
@@ -25,6 +26,7 @@ from django.utils import timezone
 from django.core.serializers.json import DjangoJSONEncoder
 
 # Third party imports
+from crum import get_current_user
 from rest_framework import status
 from rest_framework.response import Response
 
@@ -39,8 +41,7 @@ from plane.db.models import (
     WorkspaceMember,
     UserFavorite,
     Issue,
-    Label,
-    User,
+    IssueAssignee,
     UserRecentVisit,
     Project,
 )
@@ -63,6 +64,10 @@ from plane.utils.host import base_host
 from plane.utils.timezone_converter import user_timezone_converter
 
 
+# Seconds to remember how far a workspace's sprints have been generated
+SPRINT_GENERATION_CACHE_TIMEOUT = 3600
+
+
 def get_or_create_sprints_for_workspace(workspace, num_sprints=5):
     """
     Auto-generate sprints for a workspace based on sprint_start_date.
@@ -71,6 +76,7 @@ def get_or_create_sprints_for_workspace(workspace, num_sprints=5):
     Each sprint is exactly 14 days (2 weeks).
 
     If sprint_start_date is not set, defaults to the most recent Monday.
+    Callers read the sprints back from the database, so nothing is returned.
     """
     today = timezone.now().date()
 
@@ -95,36 +101,51 @@ def get_or_create_sprints_for_workspace(workspace, num_sprints=5):
     # Generate sprints from 1 to current + num_sprints
     max_sprint_number = max(1, current_sprint_number + num_sprints)
 
-    created_sprints = []
+    # Skip the generation loop while the sprints up to this number already exist
+    cache_key = f"sprint_gen:{workspace.id}:{sprint_start.isoformat()}"
+    generated_through = cache.get(cache_key)
+    if generated_through is not None and generated_through >= max_sprint_number:
+        return
+
+    existing_numbers = set(
+        Sprint.objects.filter(workspace=workspace, number__lte=max_sprint_number).values_list("number", flat=True)
+    )
+
+    # Build the missing sprints in memory
+    tz = pytz.timezone(workspace.timezone)
+    midnight = timezone.datetime.min.time()
+    user = get_current_user()
+    created_by = None if user is None or user.is_anonymous else user
+    new_sprints = []
     for sprint_num in range(1, max_sprint_number + 1):
-        # Calculate sprint dates
-        sprint_start_date = sprint_start + timedelta(days=(sprint_num - 1) * 14)
+        if sprint_num in existing_numbers:
+            continue
 
-        # Convert to datetime with workspace timezone
-        tz = pytz.timezone(workspace.timezone)
-        sprint_start_datetime = timezone.make_aware(
-            timezone.datetime.combine(sprint_start_date, timezone.datetime.min.time()),
-            tz
-        )
+        # Calculate sprint dates in the workspace timezone
+        sprint_start_date = sprint_start + timedelta(days=(sprint_num - 1) * 14)
+        sprint_start_datetime = timezone.make_aware(timezone.datetime.combine(sprint_start_date, midnight), tz)
         sprint_end_datetime = sprint_start_datetime + timedelta(days=13, hours=23, minutes=59, seconds=59)
 
-        # Get or create the sprint
-        sprint, created = Sprint.objects.get_or_create(
-            workspace=workspace,
-            number=sprint_num,
-            defaults={
-                'name': f'Sprint {sprint_num}',
-                'description': '',
-                'start_date': sprint_start_datetime,
-                'end_date': sprint_end_datetime,
-                'timezone': workspace.timezone,
-            }
+        # bulk_create skips Sprint.save(), so set its derived sort_order here
+        new_sprints.append(
+            Sprint(
+                workspace=workspace,
+                number=sprint_num,
+                name=f'Sprint {sprint_num}',
+                description='',
+                start_date=sprint_start_datetime,
+                end_date=sprint_end_datetime,
+                sort_order=sprint_num * 10000,
+                timezone=workspace.timezone,
+                created_by=created_by,
+            )
         )
 
-        if created:
-            created_sprints.append(sprint)
+    # Concurrent requests may generate the same sprints; the unique
+    # (workspace, number) constraint keeps the first insert
+    Sprint.objects.bulk_create(new_sprints, ignore_conflicts=True, batch_size=100)
 
-    return created_sprints
+    cache.set(cache_key, max_sprint_number, timeout=SPRINT_GENERATION_CACHE_TIMEOUT)
 
 
 class WorkspaceSprintViewSet(BaseViewSet):
@@ -138,6 +159,16 @@ class WorkspaceSprintViewSet(BaseViewSet):
     permission_classes = [WorkspaceEntityPermission]
     webhook_event = "sprint"
 
+    def _get_workspace(self):
+        """Load the request's workspace once and reuse it across the handler."""
+        workspace = getattr(self, "_workspace", None)
+        if workspace is None:
+            workspace = Workspace.objects.only("id", "slug", "timezone", "sprint_start_date").get(
+                slug=self.kwargs.get("slug")
+            )
+            self._workspace = workspace
+        return workspace
+
     def get_queryset(self):
         workspace_slug = self.kwargs.get("slug")
 
@@ -145,17 +176,41 @@ class WorkspaceSprintViewSet(BaseViewSet):
             user=self.request.user,
             entity_identifier=OuterRef("pk"),
             entity_type="sprint",
-            workspace__slug=workspace_slug,
+            workspace_id=OuterRef("workspace_id"),
         )
 
-        # Get workspace for timezone
-        workspace = Workspace.objects.get(slug=workspace_slug)
-        workspace_timezone = workspace.timezone
+        # Issue counts per state group, computed in one grouped pass per sprint
+        # instead of a distinct count over the sprint -> issue join for each group
+        sprint_stats = (
+            SprintIssue.objects.filter(
+                sprint_id=OuterRef("pk"),
+                deleted_at__isnull=True,
+                issue__archived_at__isnull=True,
+                issue__is_draft=False,
+                issue__deleted_at__isnull=True,
+            )
+            .order_by()
+            .values("sprint_id")
+            .annotate(
+                total=Count("issue_id"),
+                completed=Count("issue_id", filter=Q(issue__state__group="completed")),
+                cancelled=Count("issue_id", filter=Q(issue__state__group="cancelled")),
+                started=Count("issue_id", filter=Q(issue__state__group="started")),
+                unstarted=Count("issue_id", filter=Q(issue__state__group="unstarted")),
+                backlog=Count("issue_id", filter=Q(issue__state__group="backlog")),
+            )
+        )
+
+        sprint_assignees = (
+            IssueAssignee.objects.filter(issue__issue_sprint__sprint_id=OuterRef("pk"))
+            .order_by()
+            .values("issue__issue_sprint__sprint_id")
+            .annotate(ids=ArrayAgg("assignee_id", distinct=True))
+            .values("ids")
+        )
 
-        # Convert current time to workspace timezone
-        local_tz = pytz.timezone(workspace_timezone)
-        current_time_in_workspace_tz = timezone.now().astimezone(local_tz)
-        current_time_in_utc = current_time_in_workspace_tz.astimezone(pytz.utc)
+        # Sprint dates are stored in UTC, so status compares against the current UTC time
+        current_time_in_utc = timezone.now()
 
         return self.filter_queryset(
             super()
@@ -163,96 +218,13 @@ class WorkspaceSprintViewSet(BaseViewSet):
             .filter(workspace__slug=workspace_slug)
             .filter(deleted_at__isnull=True)
             .select_related("workspace")
-            .prefetch_related(
-                Prefetch(
-                    "sprint_issues__issue__assignees",
-                    queryset=User.objects.only("avatar_asset", "first_name", "id").distinct(),
-                )
-            )
-            .prefetch_related(
-                Prefetch(
-                    "sprint_issues__issue__labels",
-                    queryset=Label.objects.only("name", "color", "id").distinct(),
-                )
-            )
             .annotate(is_favorite=Exists(favorite_subquery))
-            .annotate(
-                total_issues=Count(
-                    "sprint_issues__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        sprint_issues__issue__archived_at__isnull=True,
-                        sprint_issues__issue__is_draft=False,
-                        sprint_issues__deleted_at__isnull=True,
-                        sprint_issues__issue__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                completed_issues=Count(
-                    "sprint_issues__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        sprint_issues__issue__state__group="completed",
-                        sprint_issues__issue__archived_at__isnull=True,
-                        sprint_issues__issue__is_draft=False,
-                        sprint_issues__deleted_at__isnull=True,
-                        sprint_issues__issue__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                cancelled_issues=Count(
-                    "sprint_issues__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        sprint_issues__issue__state__group="cancelled",
-                        sprint_issues__issue__archived_at__isnull=True,
-                        sprint_issues__issue__is_draft=False,
-                        sprint_issues__deleted_at__isnull=True,
-                        sprint_issues__issue__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                started_issues=Count(
-                    "sprint_issues__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        sprint_issues__issue__state__group="started",
-                        sprint_issues__issue__archived_at__isnull=True,
-                        sprint_issues__issue__is_draft=False,
-                        sprint_issues__deleted_at__isnull=True,
-                        sprint_issues__issue__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                unstarted_issues=Count(
-                    "sprint_issues__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        sprint_issues__issue__state__group="unstarted",
-                        sprint_issues__issue__archived_at__isnull=True,
-                        sprint_issues__issue__is_draft=False,
-                        sprint_issues__deleted_at__isnull=True,
-                        sprint_issues__issue__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                backlog_issues=Count(
-                    "sprint_issues__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        sprint_issues__issue__state__group="backlog",
-                        sprint_issues__issue__archived_at__isnull=True,
-                        sprint_issues__issue__is_draft=False,
-                        sprint_issues__deleted_at__isnull=True,
-                        sprint_issues__issue__deleted_at__isnull=True,
-                    ),
-                )
-            )
+            .annotate(total_issues=Coalesce(Subquery(sprint_stats.values("total")), Value(0)))
+            .annotate(completed_issues=Coalesce(Subquery(sprint_stats.values("completed")), Value(0)))
+            .annotate(cancelled_issues=Coalesce(Subquery(sprint_stats.values("cancelled")), Value(0)))
+            .annotate(started_issues=Coalesce(Subquery(sprint_stats.values("started")), Value(0)))
+            .annotate(unstarted_issues=Coalesce(Subquery(sprint_stats.values("unstarted")), Value(0)))
+            .annotate(backlog_issues=Coalesce(Subquery(sprint_stats.values("backlog")), Value(0)))
             .annotate(
                 status=Case(
                     When(
@@ -267,35 +239,26 @@ class WorkspaceSprintViewSet(BaseViewSet):
             )
             .annotate(
                 assignee_ids=Coalesce(
-                    ArrayAgg(
-                        "sprint_issues__issue__assignees__id",
-                        distinct=True,
-                        filter=~Q(sprint_issues__issue__assignees__id__isnull=True)
-                        & Q(sprint_issues__issue__issue_assignee__deleted_at__isnull=True),
-                    ),
+                    Subquery(sprint_assignees),
                     Value([], output_field=ArrayField(UUIDField())),
                 )
             )
             .order_by("number")
-            .distinct()
         )
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def list(self, request, slug):
         """List all sprints for the workspace, auto-generating if needed."""
-        workspace = Workspace.objects.get(slug=slug)
+        workspace = self._get_workspace()
 
         # Auto-generate sprints (will auto-set sprint_start_date to most recent Monday if not set)
         get_or_create_sprints_for_workspace(workspace)
-        workspace.refresh_from_db()  # Refresh to get updated sprint_start_date
 
         queryset = self.get_queryset().filter(archived_at__isnull=True)
         sprint_view = request.GET.get("sprint_view", "all")
 
         workspace_timezone = workspace.timezone
-        local_tz = pytz.timezone(workspace_timezone)
-        current_time_in_workspace_tz = timezone.now().astimezone(local_tz)
-        current_time_in_utc = current_time_in_workspace_tz.astimezone(pytz.utc)
+        current_time_in_utc = timezone.now()
 
         # Filter by sprint view
         if sprint_view == "current":
@@ -389,7 +352,7 @@ class WorkspaceSprintViewSet(BaseViewSet):
         if data is None:
             return Response({"error": "Sprint not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        workspace = Workspace.objects.get(slug=slug)
+        workspace = self._get_workspace()
         datetime_fields = ["start_date", "end_date"]
         data = user_timezone_converter(data, datetime_fields, workspace.timezone)
 
@@ -417,44 +380,52 @@ class WorkspaceSprintViewSet(BaseViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        current_instance = json.dumps(SprintSerializer(sprint).data, cls=DjangoJSONEncoder)
-
         # Only allow updating certain fields (dates are fixed)
         allowed_fields = ['name', 'description', 'logo_props', 'view_props', 'sort_order']
         update_data = {k: v for k, v in request.data.items() if k in allowed_fields}
 
+        # Record the previous values of the fields that can change, for the activity diff
+        current_instance = json.dumps(
+            {field: getattr(sprint, field) for field in allowed_fields},
+            cls=DjangoJSONEncoder,
+        )
+
         serializer = SprintWriteSerializer(sprint, data=update_data, partial=True)
         if serializer.is_valid():
-            serializer.save()
-
-            sprint_data = queryset.values(
-                "id",
-                "workspace_id",
-                "number",
-                "name",
-                "description",
-                "start_date",
-                "end_date",
-                "view_props",
-                "sort_order",
-                "external_source",
-                "external_id",
-                "progress_snapshot",
-                "logo_props",
-                "version",
-                "is_favorite",
-                "total_issues",
-                "completed_issues",
-                "cancelled_issues",
-                "started_issues",
-                "unstarted_issues",
-                "backlog_issues",
-                "assignee_ids",
-                "status",
-                "created_by",
-            ).first()
+            sprint = serializer.save()
+
+            # Only plain fields changed, so reuse the annotations loaded above
+            sprint_data = {
+                field: getattr(sprint, field)
+                for field in (
+                    "id",
+                    "workspace_id",
+                    "number",
+                    "name",
+                    "description",
+                    "start_date",
+                    "end_date",
+                    "view_props",
+                    "sort_order",
+                    "external_source",
+                    "external_id",
+                    "progress_snapshot",
+                    "logo_props",
+                    "version",
+                    "is_favorite",
+                    "total_issues",
+                    "completed_issues",
+                    "cancelled_issues",
+                    "started_issues",
+                    "unstarted_issues",
+                    "backlog_issues",
+                    "assignee_ids",
+                    "status",
+                )
+            }
+            sprint_data["created_by"] = sprint.created_by_id
 
-            workspace = Workspace.objects.get(slug=slug)
+            workspace = self._get_workspace()
             datetime_fields = ["start_date", "end_date"]
             sprint_data = user_timezone_converter(sprint_data, datetime_fields, workspace.timezone)
 
@@ -494,16 +465,24 @@ class WorkspaceSprintIssuesEndpoint(BaseAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Get existing SprintIssues for these issues
-        existing_sprint_issues = list(
-            SprintIssue.objects.filter(
-                ~Q(sprint_id=sprint_id),
-                issue_id__in=issues,
-                deleted_at__isnull=True,
-            )
+        # Get existing SprintIssues for these issues in other sprints
+        existing_sprint_issues = SprintIssue.objects.filter(
+            ~Q(sprint_id=sprint_id),
+            issue_id__in=issues,
+            deleted_at__isnull=True,
         )
-        existing_issue_ids = [str(si.issue_id) for si in existing_sprint_issues]
-        new_issue_ids = list(set(issues) - set(existing_issue_ids))
+        update_activity = [
+            {
+                "old_sprint_id": str(sprint_issue["sprint_id"]),
+                "new_sprint_id": str(sprint_id),
+                "issue_id": str(sprint_issue["issue_id"]),
+            }
+            for sprint_issue in existing_sprint_issues.values("sprint_id", "issue_id")
+        ]
+        # Deduplicate the requested issues so repeats do not become separate inserts
+        new_issue_ids = {str(issue_id) for issue_id in issues} - {
+            sprint_issue["issue_id"] for sprint_issue in update_activity
+        }
 
         # Create new SprintIssue records
         created_records = SprintIssue.objects.bulk_create(
@@ -520,20 +499,8 @@ class WorkspaceSprintIssuesEndpoint(BaseAPIView):
             batch_size=10,
         )
 
-        # Update existing SprintIssues to new sprint
-        updated_records = []
-        update_activity = []
-        for sprint_issue in existing_sprint_issues:
-            old_sprint_id = sprint_issue.sprint_id
-            sprint_issue.sprint_id = sprint_id
-            updated_records.append(sprint_issue)
-            update_activity.append({
-                "old_sprint_id": str(old_sprint_id),
-                "new_sprint_id": str(sprint_id),
-                "issue_id": str(sprint_issue.issue_id),
-            })
-
-        SprintIssue.objects.bulk_update(updated_records, ["sprint_id"], batch_size=100)
+        # Move existing SprintIssues to the new sprint
+        existing_sprint_issues.update(sprint_id=sprint_id, updated_by_id=request.user.id)
 
         issue_activity.delay(
             type="sprint.activity.created",
@@ -558,14 +525,15 @@ class WorkspaceSprintIssuesEndpoint(BaseAPIView):
         if not issue_id:
             return Response({"error": "Issue ID is required"}, status=status.HTTP_400_BAD_REQUEST)
 
-        sprint_issue = SprintIssue.objects.filter(
+        # Soft delete returns the number of rows it marked deleted
+        deleted = SprintIssue.objects.filter(
             issue_id=issue_id,
             workspace__slug=slug,
             sprint_id=sprint_id,
             deleted_at__isnull=True,
-        )
+        ).delete()
 
-        if not sprint_issue.exists():
+        if not deleted:
             return Response({"error": "Sprint issue not found"}, status=status.HTTP_404_NOT_FOUND)
 
         issue_activity.delay(
@@ -582,8 +550,6 @@ class WorkspaceSprintIssuesEndpoint(BaseAPIView):
             notification=True,
             origin=base_host(request=request, is_app=True),
         )
-
-        sprint_issue.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -600,7 +566,7 @@ class WorkspaceSprintUserPropertiesEndpoint(BaseAPIView):
         sprint_properties, _ = SprintUserProperties.objects.get_or_create(
             user=request.user,
             sprint=sprint,
-            defaults={'workspace': sprint.workspace}
+            defaults={'workspace_id': sprint.workspace_id}
         )
         serializer = SprintUserPropertiesSerializer(sprint_properties)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -608,20 +574,20 @@ class WorkspaceSprintUserPropertiesEndpoint(BaseAPIView):
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def patch(self, request, slug, sprint_id):
         """Update user properties for a sprint."""
-        sprint = Sprint.objects.get(workspace__slug=slug, pk=sprint_id)
-        sprint_properties, _ = SprintUserProperties.objects.get_or_create(
-            user=request.user,
-            sprint=sprint,
-            defaults={'workspace': sprint.workspace}
+        workspace_id = (
+            Sprint.objects.filter(workspace__slug=slug, pk=sprint_id).values_list("workspace_id", flat=True).get()
         )
-
-        sprint_properties.filters = request.data.get("filters", sprint_properties.filters)
-        sprint_properties.rich_filters = request.data.get("rich_filters", sprint_properties.rich_filters)
-        sprint_properties.display_filters = request.data.get("display_filters", sprint_properties.display_filters)
-        sprint_properties.display_properties = request.data.get(
-            "display_properties", sprint_properties.display_properties
+        defaults = {
+            field: request.data[field]
+            for field in ("filters", "rich_filters", "display_filters", "display_properties")
+            if field in request.data
+        }
+        defaults["workspace_id"] = workspace_id
+        sprint_properties, _ = SprintUserProperties.objects.update_or_create(
+            user=request.user,
+            sprint_id=sprint_id,
+            defaults=defaults,
         )
-        sprint_properties.save()
 
         serializer = SprintUserPropertiesSerializer(sprint_properties)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -636,9 +602,9 @@ class WorkspaceSprintFavoriteEndpoint(BaseAPIView):
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER], level="WORKSPACE")
     def post(self, request, slug, sprint_id):
         """Add sprint to favorites."""
-        workspace = Workspace.objects.get(slug=slug)
+        workspace_id = Workspace.objects.values_list("id", flat=True).get(slug=slug)
         UserFavorite.objects.get_or_create(
-            workspace=workspace,
+            workspace_id=workspace_id,
             user=request.user,
             entity_type="sprint",
             entity_identifier=sprint_id,
@@ -666,93 +632,7 @@ class WorkspaceSprintsEndpoint(BaseAPIView):
     permission_classes = [WorkspaceViewerPermission]
 
     def get(self, request, slug):
-        workspace = Workspace.objects.get(slug=slug)
-
-        # Auto-generate sprints if sprint_start_date is set
-        if workspace.sprint_start_date:
-            get_or_create_sprints_for_workspace(workspace)
-
-        sprints = (
-            Sprint.objects.filter(workspace__slug=slug)
-            .select_related("workspace")
-            .filter(archived_at__isnull=True)
-            .filter(deleted_at__isnull=True)
-            .annotate(
-                total_issues=Count(
-                    "sprint_issues",
-                    filter=Q(
-                        sprint_issues__issue__archived_at__isnull=True,
-                        sprint_issues__issue__is_draft=False,
-                        sprint_issues__deleted_at__isnull=True,
-                        sprint_issues__issue__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                completed_issues=Count(
-                    "sprint_issues__issue__state__group",
-                    filter=Q(
-                        sprint_issues__issue__state__group="completed",
-                        sprint_issues__issue__archived_at__isnull=True,
-                        sprint_issues__issue__is_draft=False,
-                        sprint_issues__issue__deleted_at__isnull=True,
-                        sprint_issues__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                cancelled_issues=Count(
-                    "sprint_issues__issue__state__group",
-                    filter=Q(
-                        sprint_issues__issue__state__group="cancelled",
-                        sprint_issues__issue__archived_at__isnull=True,
-                        sprint_issues__issue__is_draft=False,
-                        sprint_issues__issue__deleted_at__isnull=True,
-                        sprint_issues__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                started_issues=Count(
-                    "sprint_issues__issue__state__group",
-                    filter=Q(
-                        sprint_issues__issue__state__group="started",
-                        sprint_issues__issue__archived_at__isnull=True,
-                        sprint_issues__issue__is_draft=False,
-                        sprint_issues__issue__deleted_at__isnull=True,
-                        sprint_issues__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                unstarted_issues=Count(
-                    "sprint_issues__issue__state__group",
-                    filter=Q(
-                        sprint_issues__issue__state__group="unstarted",
-                        sprint_issues__issue__archived_at__isnull=True,
-                        sprint_issues__issue__is_draft=False,
-                        sprint_issues__issue__deleted_at__isnull=True,
-                        sprint_issues__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                backlog_issues=Count(
-                    "sprint_issues__issue__state__group",
-                    filter=Q(
-                        sprint_issues__issue__state__group="backlog",
-                        sprint_issues__issue__archived_at__isnull=True,
-                        sprint_issues__issue__is_draft=False,
-                        sprint_issues__issue__deleted_at__isnull=True,
-                        sprint_issues__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .order_by("number")
-            .distinct()
-        )
-        serializer = SprintSerializer(sprints, many=True).data
-        return Response(serializer, status=status.HTTP_200_OK)
+        return WorkspaceSprintViewSet.as_view({"get": "list"})(request._request, slug=slug)
 
 
 class SprintMaterializeEndpoint(BaseAPIView):
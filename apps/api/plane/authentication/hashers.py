@@ -0,0 +1,45 @@
+# Django imports
+from django.contrib.auth.hashers import Argon2PasswordHasher, PBKDF2PasswordHasher
+
+
+class Argon2WrappedPBKDF2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id over an existing PBKDF2-SHA256 digest.
+
+    Lets stored PBKDF2 hashes be moved to Argon2 without knowing the password
+    (Django's "wrapped hasher" upgrade). The PBKDF2 iterations and salt are
+    kept in the encoded value so the inner digest can be recomputed on login;
+    Django rehashes to plain Argon2 on the next successful login.
+
+    Format: argon2_pbkdf2_sha256$<iterations>$<pbkdf2 salt>$argon2id$v=19$...
+    """
+
+    algorithm = "argon2_pbkdf2_sha256"
+    inner_hasher = PBKDF2PasswordHasher
+
+    def _wrap(self, pbkdf2_hash):
+        inner = self.inner_hasher().decode(pbkdf2_hash)
+        # Argon2PasswordHasher.encode prefixes our algorithm; keep only "$argon2id$..."
+        argon2_data = super().encode(inner["hash"], self.salt())[len(self.algorithm) :]
+        return f"{self.algorithm}${inner['iterations']}${inner['salt']}{argon2_data}"
+
+    def encode_pbkdf2_hash(self, pbkdf2_hash):
+        """Wrap an already stored pbkdf2_sha256 hash."""
+        return self._wrap(pbkdf2_hash)
+
+    def encode(self, password, salt, iterations=None):
+        return self._wrap(self.inner_hasher().encode(password, salt, iterations))
+
+    def decode(self, encoded):
+        algorithm, iterations, pbkdf2_salt, argon2_data = encoded.split("$", 3)
+        assert algorithm == self.algorithm
+        decoded = super().decode(f"{algorithm}${argon2_data}")
+        decoded["iterations"] = int(iterations)
+        decoded["pbkdf2_salt"] = pbkdf2_salt
+        return decoded
+
+    def verify(self, password, encoded):
+        algorithm, iterations, pbkdf2_salt, argon2_data = encoded.split("$", 3)
+        assert algorithm == self.algorithm
+        inner = self.inner_hasher().encode(password, pbkdf2_salt, int(iterations))
+        return super().verify(inner.split("$", 3)[3], f"{algorithm}${argon2_data}")
@@ -1,21 +1,48 @@
 # Python imports
 import os
+from functools import lru_cache
 
 # Django imports
 from django.contrib.auth.hashers import check_password, make_password
 
 # Package imports
 from plane.authentication.adapter.credential import CredentialAdapter
+from plane.authentication.hashers import Argon2WrappedPBKDF2PasswordHasher
 from plane.db.models import User
 from plane.authentication.adapter.error import (
     AUTHENTICATION_ERROR_CODES,
     AuthenticationException,
 )
-from plane.license.utils.instance_value import get_configuration_value
+from plane.license.utils.instance_value import get_cached_configuration_value
 
-# Dummy password hash for timing attack prevention
-# We use a pre-computed hash to avoid revealing user existence via response timing
-DUMMY_PASSWORD_HASH = make_password("dummy_password_for_timing_attack_prevention")
+
+# Profile fields for email sign in; the email is the only identity data provided
+EMAIL_USER_DATA = {
+    "avatar": "",
+    "first_name": "",
+    "last_name": "",
+    "provider_id": "",
+    "is_password_autoset": False,
+}
+
+# Dummy password hashes for timing attack prevention
+# Checking against them avoids revealing user existence via response timing. They
+# are built on first use, once per hashing algorithm, instead of at import time.
+@lru_cache(maxsize=4)
+def _get_dummy_password_hash(algorithm):
+    return make_password("dummy_password_for_timing_attack_prevention", hasher=algorithm)
+
+
+def _equalize_failed_check_runtime(user, password):
+    """
+    Pad a failed password check so it costs the same as a wrapped hash.
+
+    Unknown emails are checked against a PBKDF2-in-Argon2 dummy, matching the
+    hashes wrapped by migration 0138. Plain Argon2 hashes (new or upgraded
+    accounts) skip the PBKDF2 step, so spend it here on failure.
+    """
+    if user.password.startswith("argon2$"):
+        check_password(password, _get_dummy_password_hash(Argon2WrappedPBKDF2PasswordHasher.inner_hasher.algorithm))
 
 
 class EmailProvider(CredentialAdapter):
@@ -27,7 +54,7 @@ class EmailProvider(CredentialAdapter):
         self.code = code
         self.is_signup = is_signup
 
-        (ENABLE_EMAIL_PASSWORD,) = get_configuration_value(
+        (ENABLE_EMAIL_PASSWORD,) = get_cached_configuration_value(
             [
                 {
                     "key": "ENABLE_EMAIL_PASSWORD",
@@ -52,31 +79,34 @@ class EmailProvider(CredentialAdapter):
                     error_message="AUTHENTICATION_FAILED",
                     error_code=AUTHENTICATION_ERROR_CODES["AUTHENTICATION_FAILED"],
                 )
-
-            super().set_user_data(
-                {
-                    "email": self.key,
-                    "user": {
-                        "avatar": "",
-                        "first_name": "",
-                        "last_name": "",
-                        "provider_id": "",
-                        "is_password_autoset": False,
-                    },
-                }
-            )
-            return
         else:
-            user = User.objects.filter(email=self.key).first()
+            # Only the password is checked here; the adapter loads the full user later.
+            # User.save() (run by the rehash-on-login setter) also reads the last four fields.
+            user = (
+                User.objects.filter(email=self.key)
+                .only(
+                    "id",
+                    "password",
+                    "email",
+                    "is_active",
+                    "mobile_number",
+                    "token_updated_at",
+                    "display_name",
+                    "is_superuser",
+                )
+                .first()
+            )
 
             # SECURITY: Timing attack prevention
             # Always perform password check to avoid revealing user existence
             # via response timing differences
             if user:
                 password_valid = user.check_password(self.code)
+                if not password_valid:
+                    _equalize_failed_check_runtime(user, self.code)
             else:
                 # User doesn't exist - perform dummy hash to maintain consistent timing
-                check_password(self.code, DUMMY_PASSWORD_HASH)
+                check_password(self.code, _get_dummy_password_hash(Argon2WrappedPBKDF2PasswordHasher.algorithm))
                 password_valid = False
 
             # Use generic error for both non-existent user and wrong password
@@ -87,16 +117,4 @@ class EmailProvider(CredentialAdapter):
                     error_code=AUTHENTICATION_ERROR_CODES["AUTHENTICATION_FAILED"],
                 )
 
-            super().set_user_data(
-                {
-                    "email": self.key,
-                    "user": {
-                        "avatar": "",
-                        "first_name": "",
-                        "last_name": "",
-                        "provider_id": "",
-                        "is_password_autoset": False,
-                    },
-                }
-            )
-            return
+        super().set_user_data({"email": self.key, "user": dict(EMAIL_USER_DATA)})
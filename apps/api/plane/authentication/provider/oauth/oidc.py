@@ -1,41 +1,136 @@
 # Python imports
+import base64
 import hashlib
+import http.cookiejar
 import json
 import os
 import re
-from datetime import datetime
-from urllib.parse import urlencode
+import threading
+import time
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from urllib.parse import quote, urlencode
 
 import pytz
+import requests
 from authlib.integrations.requests_client import OAuth2Session
 from authlib.oidc.discovery import get_well_known_url
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Package imports
 from plane.authentication.adapter.oauth import OauthAdapter
-from plane.license.utils.instance_value import get_configuration_value
+from plane.license.utils.instance_value import get_cached_configuration_value
 from plane.authentication.adapter.error import (
     AUTHENTICATION_ERROR_CODES,
     AuthenticationException,
 )
 
 
+_CREDS_FILE = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "oidc_credentials.json"))
+
+_oidc_credentials_cache = {"mtime": None, "data": {}}
+_oidc_credentials_lock = threading.Lock()
+
+
 def _load_oidc_credentials_from_file():
     """
     Load OIDC credentials from saved JSON file (set by federation flow).
 
+    The parsed file is kept in memory and only re-read when its mtime changes.
+
     Returns dict with keys: client_id, client_secret, issuer_url, etc.
     or empty dict if file doesn't exist.
     """
-    creds_file = os.path.join(os.path.dirname(__file__), "..", "..", "oidc_credentials.json")
-    creds_file = os.path.normpath(creds_file)
+    try:
+        mtime = os.stat(_CREDS_FILE).st_mtime_ns
+    except OSError:
+        return {}
+
+    with _oidc_credentials_lock:
+        if _oidc_credentials_cache["mtime"] == mtime:
+            return _oidc_credentials_cache["data"]
+
+        try:
+            with open(_CREDS_FILE, "r") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+        # Callers share the cached dict, so hand out a read-only view
+        _oidc_credentials_cache["mtime"] = mtime
+        _oidc_credentials_cache["data"] = MappingProxyType(data)
+        return _oidc_credentials_cache["data"]
+
+
+# X.509 DN attribute lookups and synthetic email sanitizing, compiled once
+_DN_ATTR_RE = re.compile(r"(?:^|,)\s*(CN|E|EMAILADDRESS)=([^,]*)", re.IGNORECASE)
+_NON_EMAIL_CHAR_RE = re.compile(r"[^a-z0-9.]")
+_CN_EMAIL_TRANSLATION = str.maketrans({" ": ".", ",": None})
+
+# Shared HTTP session so token and userinfo requests reuse keep-alive connections to the IdP.
+# It serves every user's login, so never store or replay IdP cookies across requests.
+_oidc_http_session = requests.Session()
+_oidc_http_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+_oidc_http_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=Retry(total=2)))
+
+# OIDC settings from the environment, read once per process
+_OIDC_ENV_KEYS = (
+    "OIDC_CLIENT_ID",
+    "OIDC_CLIENT_SECRET",
+    "OIDC_ISSUER_URL",
+    "OIDC_AUTHORIZATION_URL",
+    "OIDC_TOKEN_URL",
+    "OIDC_USERINFO_URL",
+    "OIDC_SCOPE",
+)
+_OIDC_ENV = {}
+
+
+def refresh_oidc_env():
+    """Re-read the OIDC environment variables after they change (federation, tests)."""
+    _OIDC_ENV.clear()
+    _OIDC_ENV.update({key: os.environ.get(key) for key in _OIDC_ENV_KEYS})
+
+
+refresh_oidc_env()
+
+# Seconds to reuse an issuer's discovery document before fetching it again
+OIDC_DISCOVERY_CACHE_TTL = int(os.environ.get("OIDC_DISCOVERY_CACHE_TTL", 3600))
+# Failed lookups are remembered briefly so an unreachable issuer does not add a timeout to every login
+OIDC_DISCOVERY_FAILURE_CACHE_TTL = 60
+
+_oidc_discovery_cache = {}
+_oidc_discovery_lock = threading.Lock()
+
+
+def _get_oidc_discovery(issuer_url):
+    """
+    Fetch the issuer's .well-known/openid-configuration metadata.
+
+    The parsed document is cached per issuer for OIDC_DISCOVERY_CACHE_TTL
+    seconds. Returns an empty dict if discovery fails, so callers can fall
+    back to their default endpoints; failures are cached for
+    OIDC_DISCOVERY_FAILURE_CACHE_TTL seconds.
+    """
+    now = time.monotonic()
+    with _oidc_discovery_lock:
+        cached = _oidc_discovery_cache.get(issuer_url)
+    if cached and cached[0] > now:
+        return cached[1]
 
     try:
-        if os.path.exists(creds_file):
-            with open(creds_file, "r") as f:
-                return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        pass
-    return {}
+        response = _oidc_http_session.get(get_well_known_url(issuer_url, external=True), timeout=(3.05, 10))
+        response.raise_for_status()
+        metadata = response.json()
+        expires_at = now + OIDC_DISCOVERY_CACHE_TTL
+    except (requests.RequestException, ValueError):
+        metadata = {}
+        expires_at = now + OIDC_DISCOVERY_FAILURE_CACHE_TTL
+
+    with _oidc_discovery_lock:
+        _oidc_discovery_cache[issuer_url] = (expires_at, metadata)
+    return metadata
 
 
 class OIDCClient:
@@ -74,35 +169,35 @@ class OIDCClient:
             token_url,
             userinfo_url,
             scope,
-        ) = get_configuration_value(
+        ) = get_cached_configuration_value(
             [
                 {
                     "key": "OIDC_CLIENT_ID",
-                    "default": os.environ.get("OIDC_CLIENT_ID") or file_creds.get("client_id"),
+                    "default": _OIDC_ENV["OIDC_CLIENT_ID"] or file_creds.get("client_id"),
                 },
                 {
                     "key": "OIDC_CLIENT_SECRET",
-                    "default": os.environ.get("OIDC_CLIENT_SECRET") or file_creds.get("client_secret"),
+                    "default": _OIDC_ENV["OIDC_CLIENT_SECRET"] or file_creds.get("client_secret"),
                 },
                 {
                     "key": "OIDC_ISSUER_URL",
-                    "default": os.environ.get("OIDC_ISSUER_URL") or file_creds.get("issuer_url"),
+                    "default": _OIDC_ENV["OIDC_ISSUER_URL"] or file_creds.get("issuer_url"),
                 },
                 {
                     "key": "OIDC_AUTHORIZATION_URL",
-                    "default": os.environ.get("OIDC_AUTHORIZATION_URL") or file_creds.get("authorization_url"),
+                    "default": _OIDC_ENV["OIDC_AUTHORIZATION_URL"] or file_creds.get("authorization_url"),
                 },
                 {
                     "key": "OIDC_TOKEN_URL",
-                    "default": os.environ.get("OIDC_TOKEN_URL") or file_creds.get("token_url"),
+                    "default": _OIDC_ENV["OIDC_TOKEN_URL"] or file_creds.get("token_url"),
                 },
                 {
                     "key": "OIDC_USERINFO_URL",
-                    "default": os.environ.get("OIDC_USERINFO_URL") or file_creds.get("userinfo_url"),
+                    "default": _OIDC_ENV["OIDC_USERINFO_URL"] or file_creds.get("userinfo_url"),
                 },
                 {
                     "key": "OIDC_SCOPE",
-                    "default": os.environ.get("OIDC_SCOPE", "openid email profile"),
+                    "default": _OIDC_ENV["OIDC_SCOPE"] or "openid email profile",
                 },
             ]
         )
@@ -133,6 +228,23 @@ class OIDCClient:
             code_challenge_method="S256",  # PKCE with SHA-256 (Login.gov requirement)
         )
 
+    def _get_endpoint(self, configured_url, discovery_key, default_path):
+        """
+        Resolve an OIDC endpoint.
+
+        Explicitly configured endpoints win; otherwise the issuer's discovery
+        document is used, falling back to the default path under the issuer.
+        """
+        if configured_url:
+            return configured_url
+        if not self.issuer_url:
+            return None
+        return _get_oidc_discovery(self.issuer_url).get(discovery_key) or f"{self.issuer_url}{default_path}"
+
+    def get_token_endpoint(self):
+        """Token endpoint: configured URL, discovery metadata, or the issuer default."""
+        return self._get_endpoint(self._token_url, "token_endpoint", "/oauth/token")
+
     def get_authorization_url(self, state: str) -> tuple[str, str]:
         """
         Generate authorization URL with PKCE challenge.
@@ -143,10 +255,7 @@ class OIDCClient:
         Returns:
             tuple: (authorization_url, code_verifier)
         """
-        auth_endpoint = self._authorization_url
-        if not auth_endpoint and self.issuer_url:
-            # Use OIDC discovery
-            auth_endpoint = f"{self.issuer_url}/oauth/authorize"
+        auth_endpoint = self._get_endpoint(self._authorization_url, "authorization_endpoint", "/oauth/authorize")
 
         if not auth_endpoint:
             raise AuthenticationException(
@@ -176,9 +285,7 @@ class OIDCClient:
         Returns:
             dict: Token response with access_token, id_token, etc.
         """
-        token_endpoint = self._token_url
-        if not token_endpoint and self.issuer_url:
-            token_endpoint = f"{self.issuer_url}/oauth/token"
+        token_endpoint = self.get_token_endpoint()
 
         if not token_endpoint:
             raise AuthenticationException(
@@ -186,12 +293,28 @@ class OIDCClient:
                 error_message="OIDC_NOT_CONFIGURED",
             )
 
+        data = {
+            "grant_type": "authorization_code",
+            "code": code,
+            "redirect_uri": self.redirect_uri,
+            "code_verifier": code_verifier,
+        }
+        headers = {"Accept": "application/json"}
+        if self.client_secret:
+            # client_secret_basic, encoded the same way Authlib does
+            credentials = f"{quote(self.client_id)}:{quote(self.client_secret)}"
+            headers["Authorization"] = f"Basic {base64.b64encode(credentials.encode('latin1')).decode()}"
+        else:
+            # Public client: identify with client_id in the body
+            data["client_id"] = self.client_id
+
         try:
-            token = self.session.fetch_token(
-                token_endpoint,
-                code=code,
-                code_verifier=code_verifier,
-            )
+            resp = _oidc_http_session.post(token_endpoint, data=data, headers=headers, timeout=(3.05, 10))
+            if resp.status_code >= 500:
+                resp.raise_for_status()
+            token = resp.json()
+            if "error" in token:
+                raise ValueError(f"{token['error']}: {token.get('error_description', '')}")
             return token
         except Exception as e:
             raise AuthenticationException(
@@ -209,9 +332,7 @@ class OIDCClient:
         Returns:
             dict: User info claims
         """
-        userinfo_endpoint = self._userinfo_url
-        if not userinfo_endpoint and self.issuer_url:
-            userinfo_endpoint = f"{self.issuer_url}/oauth/userinfo"
+        userinfo_endpoint = self._get_endpoint(self._userinfo_url, "userinfo_endpoint", "/oauth/userinfo")
 
         if not userinfo_endpoint:
             raise AuthenticationException(
@@ -220,12 +341,11 @@ class OIDCClient:
             )
 
         try:
-            # Create a new session with the token for userinfo request
-            session = OAuth2Session(
-                client_id=self.client_id,
-                token={"access_token": access_token, "token_type": "Bearer"},
+            resp = _oidc_http_session.get(
+                userinfo_endpoint,
+                headers={"Authorization": f"Bearer {access_token}"},
+                timeout=(3.05, 10),
             )
-            resp = session.get(userinfo_endpoint)
             resp.raise_for_status()
             return resp.json()
         except Exception as e:
@@ -296,10 +416,7 @@ class OIDCOAuthProvider(OauthAdapter):
         # Calculate token expiration
         expires_at = None
         if token.get("expires_in"):
-            expires_at = datetime.fromtimestamp(
-                datetime.now(tz=pytz.utc).timestamp() + token.get("expires_in", 3600),
-                tz=pytz.utc
-            )
+            expires_at = datetime.now(tz=pytz.utc) + timedelta(seconds=token.get("expires_in"))
 
         super().set_token_data(
             {
@@ -327,13 +444,16 @@ class OIDCOAuthProvider(OauthAdapter):
         """
         user_info = self.oidc_client.get_userinfo(self.token_data.get("access_token"))
 
+        # Parse the X.509 DN once; CN and email feed every fallback below
+        sub_dn = user_info.get("sub", "")
+        dn_cn, dn_email = self._parse_dn_attrs(sub_dn)
+
         # Extract email - try multiple locations for PIV/OIDC compatibility
-        email = self._extract_email_from_response(user_info)
+        email = self._extract_email_from_response(user_info, dn_email)
 
         # If no email found, generate synthetic from DN
         if not email:
-            sub_dn = user_info.get("sub", "")
-            email = self._generate_synthetic_email(sub_dn)
+            email = self._generate_synthetic_email(sub_dn, dn_cn)
 
         # Extract name from claims or parse from X.509 DN
         first_name = user_info.get("given_name", "")
@@ -342,8 +462,8 @@ class OIDCOAuthProvider(OauthAdapter):
         if not first_name:
             name = user_info.get("name", "")
             if not name:
-                # Parse name from X.509 DN Common Name
-                name = self._extract_cn_from_dn(user_info.get("sub", ""))
+                # Fall back to the X.509 DN Common Name
+                name = dn_cn
 
             # Split name into first/last
             name_parts = name.split(" ", 1) if name else [""]
@@ -366,7 +486,7 @@ class OIDCOAuthProvider(OauthAdapter):
         }
         super().set_user_data(user_data)
 
-    def _generate_synthetic_email(self, sub_dn: str) -> str:
+    def _generate_synthetic_email(self, sub_dn: str, cn: str) -> str:
         """
         Generate unique synthetic email from X.509 Distinguished Name.
 
@@ -375,11 +495,11 @@ class OIDCOAuthProvider(OauthAdapter):
 
         Args:
             sub_dn: X.509 Subject DN like "CN=John Doe,OU=People,O=Treasury,C=US"
+            cn: Common Name already parsed from sub_dn
 
         Returns:
             Email like "john.doe.a3f2b1@piv.treasury.gov"
         """
-        cn = self._extract_cn_from_dn(sub_dn)
         if not cn:
             cn = "unknown"
 
@@ -387,32 +507,35 @@ class OIDCOAuthProvider(OauthAdapter):
         dn_hash = hashlib.sha256(sub_dn.encode()).hexdigest()[:6]
 
         # Sanitize CN for email format (lowercase, spaces to dots, remove special chars)
-        sanitized_cn = cn.lower().replace(" ", ".").replace(",", "")
-        sanitized_cn = re.sub(r'[^a-z0-9.]', '', sanitized_cn)
+        sanitized_cn = cn.lower().translate(_CN_EMAIL_TRANSLATION)
+        sanitized_cn = _NON_EMAIL_CHAR_RE.sub("", sanitized_cn)
 
         # e.g., "john.doe.a3f2b1@piv.treasury.gov"
         return f"{sanitized_cn}.{dn_hash}@piv.treasury.gov"
 
     @staticmethod
-    def _extract_cn_from_dn(dn: str) -> str:
+    def _parse_dn_attrs(dn: str) -> tuple:
         """
-        Extract Common Name from X.509 Distinguished Name.
+        Extract the Common Name and email attribute from an X.509 DN in one scan.
 
         Args:
             dn: X.509 DN like "CN=John Doe,OU=People,O=Treasury,C=US"
 
         Returns:
-            Common Name value (e.g., "John Doe") or empty string
+            (cn, email) tuple, each the first matching value or empty string
         """
-        if not dn:
-            return ""
-        for part in dn.split(","):
-            part = part.strip()
-            if part.upper().startswith("CN="):
-                return part[3:]
-        return ""
-
-    def _extract_email_from_response(self, user_info: dict) -> str:
+        cn = email = None
+        for match in _DN_ATTR_RE.finditer(dn or ""):
+            if match.group(1).upper() == "CN":
+                if cn is None:
+                    cn = match.group(2).rstrip()
+            elif email is None:
+                email = match.group(2).rstrip()
+            if cn is not None and email is not None:
+                break
+        return cn or "", email or ""
+
+    def _extract_email_from_response(self, user_info: dict, dn_email: str) -> str:
         """
         Extract email from OIDC userinfo response, checking multiple locations.
 
@@ -425,6 +548,7 @@ class OIDCOAuthProvider(OauthAdapter):
 
         Args:
             user_info: OIDC userinfo response dict
+            dn_email: E= or emailAddress= value already parsed from the 'sub' DN
 
         Returns:
             Email address or empty string
@@ -436,8 +560,8 @@ class OIDCOAuthProvider(OauthAdapter):
 
         # 2. subject_alt_names array (some PIV providers)
         # Format: [{"type": "rfc822Name", "value": "user@agency.gov"}, ...]
-        san = user_info.get("subject_alt_names") or user_info.get("subjectAltNames") or []
-        if isinstance(san, list):
+        san = user_info.get("subject_alt_names") or user_info.get("subjectAltNames")
+        if san and isinstance(san, list):
             for entry in san:
                 if isinstance(entry, dict):
                     # Format: {"type": "rfc822Name", "value": "email@example.com"}
@@ -447,30 +571,5 @@ class OIDCOAuthProvider(OauthAdapter):
                     # Simple string format
                     return entry
 
-        # 3. Extract from X.509 Subject DN (E= or emailAddress= attributes)
-        sub_dn = user_info.get("sub", "")
-        email = self._extract_email_from_dn(sub_dn)
-        if email:
-            return email
-
-        return ""
-
-    @staticmethod
-    def _extract_email_from_dn(dn: str) -> str:
-        """
-        Extract email from X.509 DN if present (E= or emailAddress= attributes).
-
-        Args:
-            dn: X.509 DN that may contain email attribute
-
-        Returns:
-            Email address or empty string
-        """
-        if not dn:
-            return ""
-        for part in dn.split(","):
-            part = part.strip()
-            upper_part = part.upper()
-            if upper_part.startswith("E=") or upper_part.startswith("EMAILADDRESS="):
-                return part.split("=", 1)[1]
-        return ""
+        # 3. X.509 Subject DN (E= or emailAddress= attributes)
+        return dn_email
@@ -13,6 +13,7 @@ from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 
 # Module imports
+from plane.authentication.provider.oauth.oidc import refresh_oidc_env
 from plane.authentication.utils.host import base_host
 from plane.license.utils.instance_value import get_configuration_value
 
@@ -409,6 +410,9 @@ def _save_oidc_credentials(issuer_url: str, client_id: str, client_secret: str):
         os.environ["OIDC_TOKEN_URL"] = credentials["token_url"]
         os.environ["OIDC_USERINFO_URL"] = credentials["userinfo_url"]
 
+    # The OIDC provider snapshots these variables at import; pick up the new values
+    refresh_oidc_env()
+
 
 def _escape_html(text: str) -> str:
     """Escape HTML special characters."""
@@ -1,6 +1,4 @@
 # Python imports
-import json
-import os
 import uuid
 import requests
 from urllib.parse import urlparse
@@ -10,7 +8,7 @@ from django.http import HttpResponseRedirect
 from django.views import View
 
 # Package imports
-from plane.authentication.provider.oauth.oidc import OIDCOAuthProvider
+from plane.authentication.provider.oauth.oidc import OIDCClient, OIDCOAuthProvider
 from plane.authentication.utils.login import user_login
 from plane.authentication.utils.redirection_path import get_redirection_path
 from plane.authentication.utils.user_auth_workflow import post_user_auth_workflow
@@ -21,20 +19,6 @@ from plane.authentication.adapter.error import (
     AUTHENTICATION_ERROR_CODES,
 )
 from plane.utils.path_validator import get_safe_redirect_url
-from plane.license.utils.instance_value import get_configuration_value
-
-
-def _load_oidc_credentials_from_file():
-    """Load OIDC credentials from saved JSON file."""
-    creds_file = os.path.join(os.path.dirname(__file__), "..", "..", "oidc_credentials.json")
-    creds_file = os.path.normpath(creds_file)
-    try:
-        if os.path.exists(creds_file):
-            with open(creds_file, "r") as f:
-                return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        pass
-    return {}
 
 
 class OIDCOauthInitiateEndpoint(View):
@@ -45,28 +29,20 @@ class OIDCOauthInitiateEndpoint(View):
     Includes health check to verify OIDC provider is reachable before redirecting.
     """
 
-    def _is_oidc_service_healthy(self) -> bool:
+    def _is_oidc_service_healthy(self, oidc_client: OIDCClient) -> bool:
         """
         Check if the OIDC identity provider service is reachable.
 
         Performs a lightweight HEAD request to the token endpoint to verify
         the service is responding. Uses a short timeout to avoid blocking.
+        The endpoint is resolved like the token exchange does, so issuer-only
+        configurations (discovery) are checked too.
 
         Returns:
             bool: True if service is healthy, False otherwise
         """
         try:
-            # Load from file as fallback
-            file_creds = _load_oidc_credentials_from_file()
-
-            (OIDC_TOKEN_URL,) = get_configuration_value(
-                [
-                    {
-                        "key": "OIDC_TOKEN_URL",
-                        "default": os.environ.get("OIDC_TOKEN_URL") or file_creds.get("token_url"),
-                    },
-                ]
-            )
+            OIDC_TOKEN_URL = oidc_client.get_token_endpoint()
 
             if not OIDC_TOKEN_URL:
                 return False
@@ -100,22 +76,17 @@ class OIDCOauthInitiateEndpoint(View):
             )
             return HttpResponseRedirect(url)
 
-        # Health check: verify OIDC service is reachable before redirecting
-        if not self._is_oidc_service_healthy():
-            exc = AuthenticationException(
-                error_code=AUTHENTICATION_ERROR_CODES["OIDC_SERVICE_UNAVAILABLE"],
-                error_message="OIDC_SERVICE_UNAVAILABLE",
-            )
-            params = exc.get_error_dict()
-            url = get_safe_redirect_url(
-                base_url=base_host(request=request, is_app=True), next_path=next_path, params=params
-            )
-            return HttpResponseRedirect(url)
-
         try:
             state = uuid.uuid4().hex
             provider = OIDCOAuthProvider(request=request, state=state)
 
+            # Health check: verify OIDC service is reachable before redirecting
+            if not self._is_oidc_service_healthy(provider.oidc_client):
+                raise AuthenticationException(
+                    error_code=AUTHENTICATION_ERROR_CODES["OIDC_SERVICE_UNAVAILABLE"],
+                    error_message="OIDC_SERVICE_UNAVAILABLE",
+                )
+
             # Store state and PKCE code_verifier in session for validation
             request.session["state"] = state
             if provider.code_verifier:
@@ -0,0 +1,26 @@
+# Third party imports
+from celery import shared_task
+
+# Package imports
+from plane.db.models import DocumentAccessLog
+from plane.utils.exception_logger import log_exception
+
+
+# Audit rows must not be lost: retry failed writes and only ack once the row is saved
+@shared_task(autoretry_for=(Exception,), retry_backoff=True, retry_jitter=True, max_retries=5, acks_late=True)
+def document_access_log_task(document_id, user_id, workspace_id, access_type, ip_address, user_agent, metadata):
+    try:
+        access_log = DocumentAccessLog(
+            document_id=document_id,
+            user_id=user_id,
+            access_type=access_type,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            workspace_id=workspace_id,
+            metadata=metadata,
+        )
+        # No request user in the worker, so attribute the row explicitly
+        access_log.save(created_by_id=user_id)
+    except Exception as e:
+        log_exception(e)
+        raise
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.27 on 2026-10-17 10:00
+
+from django.db import migrations, models
+from django.contrib.postgres.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('db', '0135_drop_legacy_pages_tables'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='epicissue',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['epic', 'issue'], name='epic_issue_live_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='issue',
+            index=models.Index(condition=models.Q(('archived_at__isnull', True), ('is_draft', False)), fields=['state'], name='issue_active_state_idx'),
+        ),
+    ]
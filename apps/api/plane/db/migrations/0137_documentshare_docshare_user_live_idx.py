@@ -0,0 +1,19 @@
+# Generated by Django 4.2.27 on 2026-10-17 12:00
+
+from django.db import migrations, models
+from django.contrib.postgres.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('db', '0136_epicissue_epic_issue_live_idx_and_more'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='documentshare',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['user', 'document'], name='docshare_user_live_idx'),
+        ),
+    ]
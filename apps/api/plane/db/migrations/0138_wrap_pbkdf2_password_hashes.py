@@ -0,0 +1,39 @@
+# Generated by Django 4.2.27 on 2026-10-17 12:00
+
+from django.db import migrations
+
+from plane.authentication.hashers import Argon2WrappedPBKDF2PasswordHasher
+
+
+def wrap_pbkdf2_password_hashes(apps, schema_editor):
+    User = apps.get_model("db", "User")
+    hasher = Argon2WrappedPBKDF2PasswordHasher()
+
+    batch_size = 500
+
+    # Wrap every stored PBKDF2 hash so all hashes cost an Argon2 check; the
+    # plain password is not needed and users are upgraded on their next login
+    users = User.objects.filter(password__startswith="pbkdf2_sha256$").only("id", "password")
+
+    updated_users = []
+    for user in users.iterator(chunk_size=batch_size):
+        user.password = hasher.encode_pbkdf2_hash(user.password)
+        updated_users.append(user)
+
+        if len(updated_users) >= batch_size:
+            User.objects.bulk_update(updated_users, ["password"], batch_size=batch_size)
+            updated_users = []
+
+    if updated_users:
+        User.objects.bulk_update(updated_users, ["password"], batch_size=batch_size)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0137_documentshare_docshare_user_live_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(wrap_pbkdf2_password_hashes, migrations.RunPython.noop),
+    ]
@@ -357,6 +357,11 @@ class DocumentShare(BaseModel):
         indexes = [
             models.Index(fields=["document", "user"], name="docshare_doc_user_idx"),
             models.Index(fields=["user", "permission"], name="docshare_user_perm_idx"),
+            models.Index(
+                fields=["user", "document"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="docshare_user_live_idx",
+            ),
         ]
 
     def __str__(self):
@@ -158,6 +158,13 @@ class EpicIssue(ProjectBaseModel):
                 name="epic_issue_unique_issue_epic_when_deleted_at_null",
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["epic", "issue"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="epic_issue_live_idx",
+            ),
+        ]
         verbose_name = "Epic Issue"
         verbose_name_plural = "Epic Issues"
         db_table = "epic_issues"
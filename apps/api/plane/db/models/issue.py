@@ -178,6 +178,13 @@ class Issue(ProjectBaseModel):
         verbose_name_plural = "Issues"
         db_table = "issues"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["state"],
+                condition=models.Q(archived_at__isnull=True, is_draft=False),
+                name="issue_active_state_idx",
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         if self.state is None:
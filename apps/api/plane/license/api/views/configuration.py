@@ -22,7 +22,7 @@ from plane.license.models import InstanceConfiguration
 from plane.license.api.serializers import InstanceConfigurationSerializer
 from plane.license.utils.encryption import encrypt_data
 from plane.utils.cache import cache_response, invalidate_cache
-from plane.license.utils.instance_value import get_email_configuration
+from plane.license.utils.instance_value import get_email_configuration, invalidate_configuration_cache
 
 
 class InstanceConfigurationEndpoint(BaseAPIView):
@@ -49,6 +49,7 @@ class InstanceConfigurationEndpoint(BaseAPIView):
             bulk_configurations.append(configuration)
 
         InstanceConfiguration.objects.bulk_update(bulk_configurations, ["value"], batch_size=100)
+        invalidate_configuration_cache([configuration.key for configuration in bulk_configurations])
 
         serializer = InstanceConfigurationSerializer(configurations, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -60,18 +61,18 @@ class DisableEmailFeatureEndpoint(BaseAPIView):
     @invalidate_cache(path="/api/instances/", user=False)
     def delete(self, request):
         try:
-            InstanceConfiguration.objects.filter(
-                Q(
-                    key__in=[
-                        "EMAIL_HOST",
-                        "EMAIL_HOST_USER",
-                        "EMAIL_HOST_PASSWORD",
-                        "ENABLE_SMTP",
-                        "EMAIL_PORT",
-                        "EMAIL_FROM",
-                    ]
-                )
-            ).update(value=Case(When(key="ENABLE_SMTP", then=Value("0")), default=Value("")))
+            email_keys = [
+                "EMAIL_HOST",
+                "EMAIL_HOST_USER",
+                "EMAIL_HOST_PASSWORD",
+                "ENABLE_SMTP",
+                "EMAIL_PORT",
+                "EMAIL_FROM",
+            ]
+            InstanceConfiguration.objects.filter(Q(key__in=email_keys)).update(
+                value=Case(When(key="ENABLE_SMTP", then=Value("0")), default=Value(""))
+            )
+            invalidate_configuration_cache(email_keys)
             return Response(status=status.HTTP_200_OK)
         except Exception:
             return Response(
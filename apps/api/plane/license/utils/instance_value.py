@@ -3,36 +3,77 @@ import os
 
 # Django imports
 from django.conf import settings
+from django.core.cache import cache
 
 # Package imports
 from plane.license.models import InstanceConfiguration
 from plane.license.utils.encryption import decrypt_data
 
 
+def _resolve_configuration_values(keys, configurations):
+    # configurations maps a key to its InstanceConfiguration row values, if any
+    environment_list = []
+    for key in keys:
+        item = configurations.get(key.get("key"))
+        if not item:
+            environment_list.append(key.get("default"))
+        elif item.get("is_encrypted", False):
+            environment_list.append(decrypt_data(item.get("value")))
+        else:
+            environment_list.append(item.get("value"))
+    return tuple(environment_list)
+
+
 # Helper function to return value from the passed key
 def get_configuration_value(keys):
-    environment_list = []
     if settings.SKIP_ENV_VAR:
-        # Get the configurations
-        instance_configuration = InstanceConfiguration.objects.values("key", "value", "is_encrypted")
-
-        for key in keys:
-            for item in instance_configuration:
-                if key.get("key") == item.get("key"):
-                    if item.get("is_encrypted", False):
-                        environment_list.append(decrypt_data(item.get("value")))
-                    else:
-                        environment_list.append(item.get("value"))
-
-                    break
-            else:
-                environment_list.append(key.get("default"))
-    else:
-        # Get the configuration from os
-        for key in keys:
-            environment_list.append(os.environ.get(key.get("key"), key.get("default")))
+        # Get only the requested configurations, indexed by key
+        instance_configuration = {
+            item["key"]: item
+            for item in InstanceConfiguration.objects.filter(key__in=[key.get("key") for key in keys]).values(
+                "key", "value", "is_encrypted"
+            )
+        }
+        return _resolve_configuration_values(keys, instance_configuration)
 
-    return tuple(environment_list)
+    # Get the configuration from os
+    return tuple(os.environ.get(key.get("key"), key.get("default")) for key in keys)
+
+
+# Seconds the shared cache keeps configuration rows read through
+# get_cached_configuration_value; InstanceConfigurationEndpoint.patch clears them
+CONFIGURATION_CACHE_TTL = 60
+
+
+def _configuration_cache_key(key):
+    return f"instance_configuration:{key}"
+
+
+# Helper function to return values from the passed keys, cached across workers
+def get_cached_configuration_value(keys, timeout=CONFIGURATION_CACHE_TTL):
+    if not settings.SKIP_ENV_VAR:
+        return get_configuration_value(keys)
+
+    # Rows are cached as stored, so encrypted values stay encrypted in the cache
+    cache_keys = {key.get("key"): _configuration_cache_key(key.get("key")) for key in keys}
+    cached = cache.get_many(list(cache_keys.values()))
+
+    missing = [key for key, cache_key in cache_keys.items() if cache_key not in cached]
+    if missing:
+        rows = {
+            item["key"]: item
+            for item in InstanceConfiguration.objects.filter(key__in=missing).values("key", "value", "is_encrypted")
+        }
+        # An empty dict marks a key without a row, so its default is used
+        fetched = {cache_keys[key]: rows.get(key, {}) for key in missing}
+        cache.set_many(fetched, timeout)
+        cached.update(fetched)
+
+    return _resolve_configuration_values(keys, {key: cached[cache_key] for key, cache_key in cache_keys.items()})
+
+
+def invalidate_configuration_cache(keys):
+    cache.delete_many([_configuration_cache_key(key) for key in keys])
 
 
 def get_email_configuration():
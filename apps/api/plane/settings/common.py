@@ -233,6 +233,18 @@ else:
         }
     }
 
+# Password hashing: new hashes use Argon2id. Stored PBKDF2 hashes are wrapped
+# in Argon2 by migration 0138 and upgraded to plain Argon2 on the next
+# successful login
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "plane.authentication.hashers.Argon2WrappedPBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
 # Password validations
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -336,6 +348,8 @@ CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_ACCEPT_CONTENT = ["application/json"]
+# Tasks are fire-and-forget; nothing reads their return values
+CELERY_TASK_IGNORE_RESULT = True
 
 
 CELERY_IMPORTS = (
@@ -1,9 +1,21 @@
 import pytest
+from datetime import timedelta
+from uuid import uuid4
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from unittest.mock import patch
 
-from plane.db.models import Workspace, WorkspaceMember
+from plane.db.models import (
+    Profile,
+    Sprint,
+    User,
+    UserNotificationPreference,
+    UserStatusChoices,
+    Workspace,
+    WorkspaceMember,
+    WorkspaceMemberInvite,
+)
 
 
 @pytest.mark.contract
@@ -71,3 +83,167 @@ class TestWorkspaceAPI:
 
         # Optionally check the error message to confirm it's related to the duplicate slug
         assert "slug" in response.data
+
+
+@pytest.fixture
+def admin_workspace(db, create_user):
+    """Create a workspace where the test user is an admin"""
+    workspace = Workspace.objects.create(
+        name="Invite Workspace", slug="invite-workspace", id=uuid4(), owner=create_user
+    )
+    WorkspaceMember.objects.create(workspace=workspace, member=create_user, role=20)
+    return workspace
+
+
+@pytest.fixture
+def web_url(settings):
+    """Configure the app URL used to build invitation links"""
+    settings.WEB_URL = "http://localhost:3000"
+
+
+@pytest.mark.contract
+@pytest.mark.usefixtures("web_url")
+class TestWorkspaceInvitationAPI:
+    """Test inviting users to a workspace"""
+
+    @pytest.mark.django_db
+    @patch("plane.app.views.workspace.invite.workspace_invitation")
+    def test_invite_new_email_creates_shadow_user(
+        self, mock_invitation, session_client, admin_workspace, django_capture_on_commit_callbacks
+    ):
+        """Test a new email creates an invited user, membership, invite and queues the email"""
+        url = reverse("workspace-invitations", kwargs={"slug": admin_workspace.slug})
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = session_client.post(
+                url, {"emails": [{"email": "New.User@Example.gov ", "role": 15}]}, format="json"
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        user = User.objects.get(email="new.user@example.gov")
+        assert user.status == UserStatusChoices.INVITED
+        assert user.is_active is False
+        assert user.username == "new.user"
+        assert user.invitation_token
+        assert Profile.objects.filter(user=user).exists()
+        assert UserNotificationPreference.objects.filter(user=user).exists()
+
+        member = WorkspaceMember.objects.get(workspace=admin_workspace, member=user)
+        assert member.role == 15
+        invite = WorkspaceMemberInvite.objects.get(workspace=admin_workspace, email=user.email)
+        assert invite.token == user.invitation_token
+        assert invite.role == 15
+
+        mock_invitation.chunks.assert_called_once()
+        assert [args[0] for args in mock_invitation.chunks.call_args.args[0]] == ["new.user@example.gov"]
+        mock_invitation.chunks.return_value.apply_async.assert_called_once()
+
+    @pytest.mark.django_db
+    @patch("plane.app.views.workspace.invite.workspace_invitation")
+    def test_invite_deactivated_user_reactivates_membership(self, mock_invitation, session_client, admin_workspace):
+        """Test an existing inactive user is re-invited and their membership reactivated"""
+        user = User.objects.create(
+            email="former@example.gov",
+            username="former",
+            status=UserStatusChoices.DEACTIVATED,
+        )
+        WorkspaceMember.objects.create(workspace=admin_workspace, member=user, role=5, is_active=False)
+        url = reverse("workspace-invitations", kwargs={"slug": admin_workspace.slug})
+
+        response = session_client.post(url, {"emails": [{"email": "former@example.gov", "role": 15}]}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+
+        user.refresh_from_db()
+        assert user.status == UserStatusChoices.INVITED
+        assert user.invitation_token
+        assert User.objects.filter(email="former@example.gov").count() == 1
+
+        member = WorkspaceMember.objects.get(workspace=admin_workspace, member=user)
+        assert member.is_active is True
+        assert member.role == 15
+        assert WorkspaceMemberInvite.objects.get(workspace=admin_workspace, email=user.email).token == (
+            user.invitation_token
+        )
+
+    @pytest.mark.django_db
+    @patch("plane.app.views.workspace.invite.workspace_invitation")
+    def test_invite_active_member_is_rejected(self, mock_invitation, session_client, admin_workspace):
+        """Test inviting an already active member returns the conflicting members and writes nothing"""
+        user = User.objects.create(email="member@example.gov", username="member")
+        WorkspaceMember.objects.create(workspace=admin_workspace, member=user, role=15)
+        url = reverse("workspace-invitations", kwargs={"slug": admin_workspace.slug})
+
+        response = session_client.post(
+            url,
+            {"emails": [{"email": "member@example.gov", "role": 15}, {"email": "other@example.gov", "role": 15}]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["error"] == "Some users are already member of workspace"
+        assert [member["member"]["id"] for member in response.data["workspace_users"]] == [user.id]
+        assert not User.objects.filter(email="other@example.gov").exists()
+        assert not WorkspaceMemberInvite.objects.filter(workspace=admin_workspace).exists()
+        mock_invitation.chunks.assert_not_called()
+
+    @pytest.mark.django_db
+    @patch("plane.app.views.workspace.invite.workspace_invitation")
+    def test_invite_duplicate_email_in_one_request(self, mock_invitation, session_client, admin_workspace):
+        """Test the same email listed twice creates a single user, membership and invite"""
+        url = reverse("workspace-invitations", kwargs={"slug": admin_workspace.slug})
+
+        response = session_client.post(
+            url,
+            {"emails": [{"email": "twice@example.gov", "role": 5}, {"email": "TWICE@example.gov", "role": 15}]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        user = User.objects.get(email="twice@example.gov")
+        assert WorkspaceMember.objects.filter(workspace=admin_workspace, member=user).count() == 1
+        assert WorkspaceMemberInvite.objects.filter(workspace=admin_workspace, email=user.email).count() == 1
+        # The last entry for an email wins
+        assert WorkspaceMember.objects.get(workspace=admin_workspace, member=user).role == 15
+
+    @pytest.mark.django_db
+    def test_invite_higher_role_is_rejected(self, session_client, admin_workspace, create_user):
+        """Test a member cannot invite someone with a higher role than their own"""
+        WorkspaceMember.objects.filter(workspace=admin_workspace, member=create_user).update(role=15)
+        url = reverse("workspace-invitations", kwargs={"slug": admin_workspace.slug})
+
+        response = session_client.post(url, {"emails": [{"email": "boss@example.gov", "role": 20}]}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["error"] == "You cannot invite a user with higher role"
+        assert not User.objects.filter(email="boss@example.gov").exists()
+
+
+@pytest.mark.contract
+class TestWorkspaceSprintAPI:
+    """Test workspace sprint listing and auto-generation"""
+
+    @pytest.fixture(autouse=True)
+    def local_cache(self, settings):
+        """Keep the sprint generation marker out of the shared cache"""
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+    @pytest.mark.django_db
+    def test_generated_sprints_are_ordered_by_number(self, session_client, admin_workspace):
+        """Test bulk-generated sprints get the same sort_order as sprints created one by one"""
+        admin_workspace.sprint_start_date = timezone.now().date() - timedelta(days=30)
+        admin_workspace.save(update_fields=["sprint_start_date"])
+        Sprint.objects.create(
+            workspace=admin_workspace,
+            number=2,
+            start_date=timezone.now() - timedelta(days=16),
+        )
+        url = reverse("workspace-sprints", kwargs={"slug": admin_workspace.slug})
+
+        response = session_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        # Today falls in Sprint 3, so Sprints 1 to 8 exist
+        sprints = list(Sprint.objects.filter(workspace=admin_workspace).values_list("number", "sort_order"))
+        assert sprints == [(number, number * 10000) for number in range(1, 9)]
@@ -0,0 +1,39 @@
+import pytest
+from django.contrib.auth.hashers import check_password, identify_hasher, make_password
+
+from plane.authentication.hashers import Argon2WrappedPBKDF2PasswordHasher
+
+
+@pytest.mark.unit
+class TestArgon2WrappedPBKDF2PasswordHasher:
+    """Test wrapping stored PBKDF2 hashes in Argon2"""
+
+    def test_wrapped_hash_verifies_original_password(self):
+        """Test a wrapped PBKDF2 hash still accepts the original password only"""
+        pbkdf2_hash = make_password("correct-password", hasher="pbkdf2_sha256")
+        wrapped = Argon2WrappedPBKDF2PasswordHasher().encode_pbkdf2_hash(pbkdf2_hash)
+
+        assert wrapped.startswith("argon2_pbkdf2_sha256$600000$")
+        assert identify_hasher(wrapped).algorithm == "argon2_pbkdf2_sha256"
+        assert check_password("correct-password", wrapped) is True
+        assert check_password("wrong-password", wrapped) is False
+
+    def test_wrapped_hash_is_upgraded_on_login(self):
+        """Test a successful check rehashes the password with the preferred hasher"""
+        wrapped = make_password("correct-password", hasher="argon2_pbkdf2_sha256")
+        rehashed = []
+
+        assert check_password("correct-password", wrapped, setter=rehashed.append) is True
+        assert rehashed == ["correct-password"]
+
+    def test_decode_keeps_pbkdf2_parameters(self):
+        """Test decode exposes both the PBKDF2 and Argon2 parameters"""
+        pbkdf2_hash = make_password("correct-password", salt="pbkdf2salt", hasher="pbkdf2_sha256")
+        decoded = Argon2WrappedPBKDF2PasswordHasher().decode(
+            Argon2WrappedPBKDF2PasswordHasher().encode_pbkdf2_hash(pbkdf2_hash)
+        )
+
+        assert decoded["algorithm"] == "argon2_pbkdf2_sha256"
+        assert decoded["iterations"] == 600000
+        assert decoded["pbkdf2_salt"] == "pbkdf2salt"
+        assert decoded["variety"] == "argon2id"
@@ -0,0 +1,186 @@
+import base64
+import email.message
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from requests.cookies import MockRequest, MockResponse
+
+from plane.authentication.adapter.error import AuthenticationException
+from plane.authentication.provider.oauth.oidc import (
+    OIDCClient,
+    OIDCOAuthProvider,
+    _oidc_discovery_cache,
+    _oidc_http_session,
+)
+
+OIDC_MODULE = "plane.authentication.provider.oauth.oidc"
+TOKEN_URL = "https://idp.example.gov/oauth/token"
+
+
+def _build_client(client_secret="s3cret/+"):
+    """Build an OIDCClient with explicit endpoints and no config lookups"""
+    config = (
+        "client id",
+        client_secret,
+        "https://idp.example.gov",
+        "https://idp.example.gov/oauth/authorize",
+        TOKEN_URL,
+        "https://idp.example.gov/oauth/userinfo",
+        "openid email profile",
+    )
+    with (
+        patch(f"{OIDC_MODULE}.get_cached_configuration_value", return_value=config),
+        patch(f"{OIDC_MODULE}._load_oidc_credentials_from_file", return_value={}),
+    ):
+        return OIDCClient(redirect_uri="https://plane.example.gov/auth/oidc/callback/")
+
+
+def _token_response(payload, status_code=200):
+    response = Mock(status_code=status_code)
+    response.json.return_value = payload
+    response.raise_for_status.side_effect = Exception(f"{status_code} Server Error")
+    return response
+
+
+@pytest.mark.unit
+class TestOIDCClientFetchToken:
+    """Test the authorization code exchange against the token endpoint"""
+
+    @patch(f"{OIDC_MODULE}._oidc_http_session")
+    def test_confidential_client_uses_client_secret_basic(self, mock_session):
+        """Test a client secret is sent as an Authlib-compatible Basic header"""
+        mock_session.post.return_value = _token_response({"access_token": "abc", "expires_in": 300})
+
+        token = _build_client().fetch_token("auth-code", "verifier")
+
+        assert token == {"access_token": "abc", "expires_in": 300}
+        url = mock_session.post.call_args.args[0]
+        kwargs = mock_session.post.call_args.kwargs
+        assert url == TOKEN_URL
+        # Same quoting as authlib.oauth2.auth.encode_client_secret_basic
+        expected = base64.b64encode(b"client%20id:s3cret/%2B").decode()
+        assert kwargs["headers"]["Authorization"] == f"Basic {expected}"
+        assert "client_id" not in kwargs["data"]
+        assert kwargs["data"] == {
+            "grant_type": "authorization_code",
+            "code": "auth-code",
+            "redirect_uri": "https://plane.example.gov/auth/oidc/callback/",
+            "code_verifier": "verifier",
+        }
+
+    @patch(f"{OIDC_MODULE}._oidc_http_session")
+    def test_public_client_sends_client_id_in_body(self, mock_session):
+        """Test a client without a secret identifies itself in the form body"""
+        mock_session.post.return_value = _token_response({"access_token": "abc"})
+
+        _build_client(client_secret=None).fetch_token("auth-code", "verifier")
+
+        kwargs = mock_session.post.call_args.kwargs
+        assert "Authorization" not in kwargs["headers"]
+        assert kwargs["data"]["client_id"] == "client id"
+
+    @patch(f"{OIDC_MODULE}._oidc_http_session")
+    def test_error_payload_raises(self, mock_session):
+        """Test an OAuth error body is raised as an authentication error"""
+        mock_session.post.return_value = _token_response(
+            {"error": "invalid_grant", "error_description": "code expired"}, status_code=400
+        )
+
+        with pytest.raises(AuthenticationException) as exc_info:
+            _build_client().fetch_token("auth-code", "verifier")
+
+        assert "invalid_grant: code expired" in exc_info.value.error_message
+
+    @patch(f"{OIDC_MODULE}._oidc_http_session")
+    def test_server_error_raises(self, mock_session):
+        """Test a 5xx from the token endpoint is raised as an authentication error"""
+        mock_session.post.return_value = _token_response({}, status_code=503)
+
+        with pytest.raises(AuthenticationException) as exc_info:
+            _build_client().fetch_token("auth-code", "verifier")
+
+        assert "503 Server Error" in exc_info.value.error_message
+
+    def test_shared_session_does_not_store_idp_cookies(self):
+        """Test Set-Cookie from the IdP is not kept for later users' requests"""
+        request = requests.Request("POST", TOKEN_URL).prepare()
+        headers = email.message.Message()
+        headers["Set-Cookie"] = "idp_session=abc; Path=/"
+
+        _oidc_http_session.cookies.extract_cookies(MockResponse(headers), MockRequest(request))
+
+        assert len(_oidc_http_session.cookies) == 0
+
+
+@pytest.mark.unit
+class TestOIDCDiscovery:
+    """Test endpoint resolution through the cached discovery document"""
+
+    def setup_method(self):
+        _oidc_discovery_cache.clear()
+
+    @patch(f"{OIDC_MODULE}._oidc_http_session")
+    def test_issuer_only_config_resolves_token_endpoint(self, mock_session):
+        """Test the token endpoint comes from discovery when not configured"""
+        mock_session.get.return_value = Mock(**{"json.return_value": {"token_endpoint": "https://idp/token"}})
+        client = _build_client()
+        client._token_url = None
+
+        assert client.get_token_endpoint() == "https://idp/token"
+
+    @patch(f"{OIDC_MODULE}._oidc_http_session")
+    def test_failed_discovery_is_cached(self, mock_session):
+        """Test an unreachable issuer is not retried on every call"""
+        mock_session.get.side_effect = requests.ConnectionError("unreachable")
+        client = _build_client()
+        client._token_url = None
+
+        assert client.get_token_endpoint() == "https://idp.example.gov/oauth/token"
+        assert client.get_token_endpoint() == "https://idp.example.gov/oauth/token"
+        assert mock_session.get.call_count == 1
+
+
+@pytest.mark.unit
+class TestParseDnAttrs:
+    """Test CN and email extraction from X.509 subject DNs"""
+
+    @pytest.mark.parametrize(
+        "dn,expected",
+        [
+            ("CN=John Doe,OU=People,O=Treasury,C=US", ("John Doe", "")),
+            ("CN=John Doe,E=john.doe@example.gov,O=Treasury", ("John Doe", "john.doe@example.gov")),
+            ("EMAILADDRESS=jane@example.gov,CN=Jane Roe,C=US", ("Jane Roe", "jane@example.gov")),
+            ("CN=Jane Roe, emailAddress=jane@example.gov", ("Jane Roe", "jane@example.gov")),
+        ],
+    )
+    def test_cn_and_email_attributes(self, dn, expected):
+        """Test CN, E and EMAILADDRESS are read wherever they appear"""
+        assert OIDCOAuthProvider._parse_dn_attrs(dn) == expected
+
+    def test_attribute_names_are_case_insensitive(self):
+        """Test lower and mixed case attribute names are matched"""
+        assert OIDCOAuthProvider._parse_dn_attrs("cn=John Doe,e=john@example.gov") == ("John Doe", "john@example.gov")
+        assert OIDCOAuthProvider._parse_dn_attrs("Cn=John Doe,EmailAddress=john@example.gov") == (
+            "John Doe",
+            "john@example.gov",
+        )
+
+    def test_first_value_wins_even_when_empty(self):
+        """Test an empty first attribute is not replaced by a later one"""
+        assert OIDCOAuthProvider._parse_dn_attrs("CN=,CN=John Doe,E=,E=john@example.gov") == ("", "")
+
+    def test_trailing_whitespace_is_stripped(self):
+        """Test values are stripped before the next RDN separator"""
+        assert OIDCOAuthProvider._parse_dn_attrs("CN=John Doe  , E=john@example.gov ") == (
+            "John Doe",
+            "john@example.gov",
+        )
+
+    @pytest.mark.parametrize(
+        "dn",
+        ["", None, "OU=People,O=Treasury,C=US", "OU=CN Team,O=E Corp,SERIALNUMBER=1234"],
+    )
+    def test_dn_without_cn_or_email(self, dn):
+        """Test DNs without the attributes, including look-alike values, yield empty strings"""
+        assert OIDCOAuthProvider._parse_dn_attrs(dn) == ("", "")
@@ -25,8 +25,9 @@ def user_timezone_converter(queryset, datetime_fields, user_timezone):
         # Iterate over the datetime fields
         for field in datetime_fields:
             # Convert the datetime field to the user's timezone
-            if field in item and item[field]:
-                item[field] = item[field].astimezone(user_tz)
+            value = item.get(field)
+            if value:
+                item[field] = value.astimezone(user_tz)
 
     # If queryset was a single item, return a single item
     if isinstance(queryset, dict):